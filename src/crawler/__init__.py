@@ -1,9 +1,10 @@
 """爬虫模块"""
 
+from .feed_parser import parse_feed
 from .base import BaseCrawler
 from .rss_crawler import BaseRSSCrawler
 from .arxiv_crawler import ArXivRSSCrawler
 from .crawler_manager import CrawlerManager
 
-__all__ = ['BaseCrawler', 'BaseRSSCrawler', 'ArXivRSSCrawler', 'CrawlerManager']
+__all__ = ['parse_feed', 'BaseCrawler', 'BaseRSSCrawler', 'ArXivRSSCrawler', 'CrawlerManager']
 
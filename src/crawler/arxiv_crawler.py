@@ -1,14 +1,24 @@
 """ArXiv RSS 爬虫实现"""
 
 import re
+import sys
 
 from .rss_crawler import BaseRSSCrawler
 from ..models.site_config import SiteConfig
 
 
+# 描述中的 ArXiv ID（如 arXiv:2511.09563v1），模块加载时预编译
+_ARXIV_ID_RE = re.compile(r'arXiv:(\d{4}\.\d{4,5})')
+# guid 中 ArXiv ID 的前缀（如 oai:arXiv.org:2511.09563v1）
+_GUID_PREFIX = 'arXiv.org:'
+
+
 class ArXivRSSCrawler(BaseRSSCrawler):
     """ArXiv RSS 爬虫，专门处理 ArXiv 的特殊格式"""
     
+    # 注意：feedparser 返回的条目是 dict 子类（FeedParserDict），因此 _extract_* 方法
+    # 只使用 entry.get() 一条路径，不再区分字典访问和属性访问。
+    
     def __init__(self, site_config: SiteConfig, translator=None):
         """
         初始化 ArXiv RSS 爬虫
@@ -80,17 +90,10 @@ class ArXivRSSCrawler(BaseRSSCrawler):
         if not description:
             return ''
         
-        # 处理 ArXiv 格式：提取 "Abstract:" 之后的内容
-        if 'Abstract:' in description:
-            # 找到 "Abstract:" 的位置
-            abstract_start = description.find('Abstract:')
-            if abstract_start != -1:
-                # 提取 "Abstract:" 之后的内容
-                abstract = description[abstract_start + len('Abstract:'):].strip()
-                return abstract
-        
+        # 处理 ArXiv 格式：提取 "Abstract:" 之后的内容（一次扫描完成查找和切分）
         # 如果不是 ArXiv 格式，直接返回
-        return description.strip()
+        _, sep, abstract = description.partition('Abstract:')
+        return abstract.strip() if sep else description.strip()
     
     def _extract_authors(self, entry: dict) -> list[str]:
         """
@@ -106,30 +109,16 @@ class ArXivRSSCrawler(BaseRSSCrawler):
         Returns:
             作者列表
         """
-        authors = []
-        # 方法1: 检查 dc_creators（列表）
-        if isinstance(entry, dict) and 'dc_creators' in entry and entry['dc_creators']:
-            authors = entry['dc_creators']
-        # 方法2: 检查 dc_creator（单个字符串或列表）
-        elif isinstance(entry, dict) and 'dc_creator' in entry and entry['dc_creator']:
-            # dc_creator 可能是字符串或列表
-            if isinstance(entry['dc_creator'], list):
-                authors = entry['dc_creator']
-            else:
-                authors = [entry['dc_creator']]
-        # 方法3: 尝试从字典中获取
-        elif isinstance(entry, dict):
-            if 'dc_creators' in entry:
-                authors = entry['dc_creators']
-            elif 'dc_creator' in entry:
-                creator = entry['dc_creator']
-                authors = [creator] if isinstance(creator, str) else creator
-        # 方法4: 回退到父类方法
+        # 方法1: dc_creators（列表）；方法2: dc_creator（单个字符串或列表）
+        authors = entry.get('dc_creators') or entry.get('dc_creator') or []
+        if isinstance(authors, str):
+            authors = [authors]
+        # 方法3: 回退到父类方法
         if not authors:
             authors = self._extract_authors_generic(entry)
         
-        # 清理作者名称（去除多余空格）
-        cleaned_authors = [author.strip() for author in authors if author and author.strip()]
+        # 清理作者名称（去除多余空格），驻留字符串使跨条目重复的作者名只保留一份
+        cleaned_authors = [sys.intern(author.strip()) for author in authors if author and author.strip()]
         return cleaned_authors
     
     def _extract_categories(self, entry: dict) -> list[str]:
@@ -147,34 +136,28 @@ class ArXivRSSCrawler(BaseRSSCrawler):
         categories = []
         
         # 方法1: 检查 tags 字段（feedparser 标准格式）
-        if isinstance(entry, dict) and 'tags' in entry and entry['tags']:
+        tags = entry.get('tags')
+        if tags:
             categories = [tag.get('term', '') if isinstance(tag, dict) else str(tag)
-                         for tag in entry['tags']]
-        # 方法2: 检查 category 字段
-        elif isinstance(entry, dict) and 'category' in entry and entry['category']:
-            if isinstance(entry['category'], list):
-                categories = [str(cat) for cat in entry['category']]
-            else:
-                categories = [str(entry['category'])]
-        # 方法3: 从字典中获取
-        elif isinstance(entry, dict):
-            if 'tags' in entry:
-                tags = entry['tags']
-                categories = [tag.get('term', '') if isinstance(tag, dict) else str(tag)
-                           for tag in tags]
-            elif 'category' in entry:
-                cat = entry['category']
-                categories = [cat] if isinstance(cat, str) else [str(c) for c in cat]
+                         for tag in tags]
+        else:
+            # 方法2: 检查 category 字段
+            category = entry.get('category')
+            if category:
+                if isinstance(category, list):
+                    categories = [str(cat) for cat in category]
+                else:
+                    categories = [str(category)]
         
         # 如果还是没有，使用父类方法
         if not categories:
             categories = self._extract_categories_generic(entry)
         
-        # 清理分类名称
-        cleaned_categories = [cat.strip() for cat in categories if cat and cat.strip()]
+        # 清理分类名称（cs.LG 等分类在整个 feed 中大量重复，驻留后共享同一对象）
+        cleaned_categories = [sys.intern(cat.strip()) for cat in categories if cat and cat.strip()]
         return cleaned_categories
     
-    def _extract_arxiv_id(self, entry: dict | object, link: str) -> str:
+    def _extract_arxiv_id(self, entry: dict, link: str) -> str:
         """
         提取 ArXiv ID
         
@@ -194,52 +177,35 @@ class ArXivRSSCrawler(BaseRSSCrawler):
         
         # 方法1: 从 guid 中提取（格式：oai:arXiv.org:2511.09563v1）
         # feedparser 会将 guid 解析为 entry.id
-        guid = ''
-        if isinstance(entry, dict):
-            # 如果是字典，使用字典访问方式
-            guid = entry.get('id', '') or entry.get('guid', '')
-        elif hasattr(entry, 'id'):
-            # feedparser 对象有 id 属性，使用 getattr 避免类型检查错误
-            entry_id = getattr(entry, 'id', None)
-            if entry_id:
-                guid = entry_id if isinstance(entry_id, str) else str(entry_id)
-        elif hasattr(entry, 'guid'):
-            entry_guid = getattr(entry, 'guid', None)
-            if entry_guid:
-                guid = entry_guid if isinstance(entry_guid, str) else getattr(entry_guid, 'value', '')
+        guid = entry.get('id') or entry.get('guid') or ''
         
-        if guid and 'arXiv.org:' in guid:
+        if guid:
             # 提取 "arXiv.org:" 之后的部分
-            parts = guid.split('arXiv.org:')
-            if len(parts) > 1:
-                arxiv_id_with_version = parts[1]
+            _, sep, arxiv_id_with_version = guid.partition(_GUID_PREFIX)
+            if sep:
                 # 移除版本号（如 v1, v2）
-                arxiv_id = arxiv_id_with_version.split('v')[0]
+                version_start = arxiv_id_with_version.find('v')
+                arxiv_id = arxiv_id_with_version[:version_start] if version_start != -1 else arxiv_id_with_version
         
         # 方法2: 从链接中提取（格式：https://arxiv.org/abs/2511.09563）
         if not arxiv_id and 'arxiv.org' in link:
-            parts = link.split('/')
-            if 'abs' in parts:
-                idx = parts.index('abs')
-                if idx + 1 < len(parts):
-                    arxiv_id = parts[idx + 1]
+            abs_start = link.find('/abs/')
+            if abs_start != -1:
+                arxiv_id = link[abs_start + len('/abs/'):].partition('/')[0]
         
         # 方法3: 从 description/summary 中提取（格式：arXiv:2511.09563v1）
         if not arxiv_id:
-            # 安全地获取 description/summary，处理 dict 和 object 类型
-            if isinstance(entry, dict):
-                description = entry.get('summary', '') or entry.get('description', '')
-            else:
-                description = getattr(entry, 'summary', '') or getattr(entry, 'description', '')
+            # 获取 description/summary
+            description = entry.get('summary') or entry.get('description') or ''
             if 'arXiv:' in description:
                 # 使用正则表达式提取
-                match = re.search(r'arXiv:(\d{4}\.\d{4,5})', description)
+                match = _ARXIV_ID_RE.search(description)
                 if match:
                     arxiv_id = match.group(1)
         
         return arxiv_id
     
-    def _extract_announce_type(self, entry: dict | object) -> str:
+    def _extract_announce_type(self, entry: dict) -> str:
         """
         提取 ArXiv 公告类型
         
@@ -249,11 +215,7 @@ class ArXivRSSCrawler(BaseRSSCrawler):
         Returns:
             公告类型（如 "new"）
         """
-        if isinstance(entry, dict):
-            return entry.get('arxiv_announce_type', '')
-        elif hasattr(entry, 'arxiv_announce_type'):
-            # 使用 getattr 避免类型检查错误
-            result = getattr(entry, 'arxiv_announce_type', '')
-            return result if isinstance(result, str) else str(result) if result else ''
-        else:
+        result = entry.get('arxiv_announce_type')
+        if not result:
             return ''
+        return result if isinstance(result, str) else str(result)
@@ -1,16 +1,52 @@
 """基础爬虫类"""
 
+import asyncio
+import logging
+import re
+import threading
+import requests
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
+from requests.adapters import HTTPAdapter
 
 from ..models.site_config import SiteConfig
 from ..models.crawl_result import CrawlResult
 from ..models.crawl_item import CrawlItem
+from ..filters.time_filter import TimeContext, TimeRangeFilter, iter_time_filters, use_time_context
+from ..utils.keyword_matcher import KeywordAutomaton, build_keyword_automaton
 
 if TYPE_CHECKING:
     from ..filters.base import BaseFilter
 
+
+# 每个线程各自的 HTTP 会话（requests.Session 不保证线程安全，爬虫可能在不同线程中并发运行）
+_thread_local = threading.local()
+
+
+def _get_http_session() -> requests.Session:
+    """
+    获取当前线程的 HTTP 会话（带连接池），首次调用时创建
+    
+    连接池让同一线程中对同一主机的请求复用 TCP/TLS 连接。
+    """
+    session = getattr(_thread_local, 'http_session', None)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        _thread_local.http_session = session
+    return session
+
+
+def _count_stage(items: Iterable[CrawlItem], counts: list[int], index: int) -> Iterator[CrawlItem]:
+    """在过滤阶段之间计数（只统计通过该阶段的条目，不改变数据流）"""
+    for item in items:
+        counts[index] += 1
+        yield item
+
+
 class BaseCrawler(ABC):
     """所有爬虫的基类"""
     
@@ -24,6 +60,22 @@ class BaseCrawler(ABC):
         self.site_config = site_config
         # 过滤器链，在主程序中注入
         self.filters: list["BaseFilter"] = []
+        # 过滤器链配置的键（FilterManager.config_key），用于判断过滤条件是否与上次运行相同
+        self.filters_key: str | None = None
+        # 过滤器链中（包括嵌套的 AND/OR/NOT）是否含有时间过滤器，在 set_filters 时计算
+        self._has_time_filter = False
+        # 旧关键词过滤使用的合并正则（按关键词列表懒编译并缓存）
+        self._keyword_pattern: re.Pattern | None = None
+        self._keyword_pattern_key: tuple[str, ...] = ()
+        # (原始关键词, 小写关键词) 对，与合并正则一同缓存，避免每个条目重复 lower()
+        self._keyword_pairs: list[tuple[str, str]] = []
+        # 关键词较多且安装了 hyperscan / pyahocorasick / numba 时使用的多模式自动机
+        self._keyword_automaton: KeywordAutomaton | None = None
+    
+    @property
+    def http_session(self) -> requests.Session:
+        """当前线程的 HTTP 会话（带连接池）"""
+        return _get_http_session()
     
     @abstractmethod
     def crawl(self) -> CrawlResult:
@@ -35,6 +87,29 @@ class BaseCrawler(ABC):
         """
         pass
     
+    async def crawl_async(self, session=None) -> CrawlResult:
+        """
+        异步执行爬取操作
+        
+        默认在线程中运行同步的 crawl()：抓取以网络 I/O 为主，
+        多个站点可以通过 asyncio.gather 并发执行。
+        
+        Args:
+            session: 共享的 aiohttp.ClientSession（可选，默认实现不使用）
+        
+        Returns:
+            CrawlResult: 爬取结果
+        """
+        return await asyncio.to_thread(self.crawl)
+    
+    def commit_crawl_state(self):
+        """
+        爬取结果导出成功后调用，保存需要跨运行保留的爬取状态
+        
+        默认没有需要保存的状态，子类按需重写（如 RSS 爬虫的 ETag / Last-Modified）。
+        """
+        pass
+    
     @abstractmethod
     def extract_published_time(self, entry: dict) -> datetime | None:
         """
@@ -87,20 +162,30 @@ class BaseCrawler(ABC):
         """
         pass
     
-    def parse_entry(self, entry: dict) -> CrawlItem | None:
+    def parse_entry(
+        self,
+        entry: dict,
+        published_time: datetime | None = None,
+        fast_reject: Callable[[datetime], bool] | None = None,
+    ) -> CrawlItem | None:
         """
         解析条目为 CrawlItem（通用方法，调用各个提取方法）
         
         Args:
             entry: 原始条目数据
+            published_time: 调用方已提取的发布时间（可选），传入时不再重复解析
+            fast_reject: 提前淘汰判断函数（可选），返回 True 时跳过其余字段的提取
             
         Returns:
-            CrawlItem 对象，如果解析失败返回 None
+            CrawlItem 对象，如果解析失败或被提前淘汰返回 None
         """
         try:
-            published_time = self.extract_published_time(entry)
+            if published_time is None:
+                published_time = self.extract_published_time(entry)
             if not published_time:
                 return None
+            if fast_reject is not None and fast_reject(published_time):
+                return None
             
             title = self.extract_title(entry)
             link = self.extract_link(entry)
@@ -115,75 +200,167 @@ class BaseCrawler(ABC):
         except Exception:
             return None
     
-    def set_filters(self, filters: list["BaseFilter"]) -> None:
-        """设置过滤器链"""
+    def build_fast_reject(self, time_context: TimeContext | None = None) -> Callable[[datetime], bool] | None:
+        """
+        根据顶层时间过滤器生成提前淘汰判断函数（用于 parse_entry 的 fast_reject 参数）
+        
+        顶层过滤器按 AND 串联，任一顶层时间过滤器淘汰的条目都不会出现在最终结果中；
+        嵌套在 OR/NOT 中的时间过滤器无法据此提前判断，不参与。
+        
+        Args:
+            time_context: 本轮爬取共用的时间上下文（可选），应与之后 apply_filters 使用的相同
+        
+        Returns:
+            判断函数，没有可用的时间过滤器时返回 None
+        """
+        checks = []
+        for flt in self.filters:
+            if isinstance(flt, TimeRangeFilter):
+                check = flt.make_reject_check(time_context)
+                if check is not None:
+                    checks.append(check)
+        if not checks:
+            return None
+        if len(checks) == 1:
+            return checks[0]
+        return lambda pub: any(check(pub) for check in checks)
+    
+    def set_filters(self, filters: list["BaseFilter"], config_key: str | None = None) -> None:
+        """
+        设置过滤器链
+        
+        Args:
+            filters: 过滤器列表
+            config_key: 过滤器配置的键（可选），过滤条件变化时用于放弃上次的条件请求状态
+        """
         self.filters = filters or []
+        self.filters_key = config_key
+        self._has_time_filter = self._contains_time_filter(self.filters)
+    
+    @staticmethod
+    def _contains_time_filter(filters: list["BaseFilter"]) -> bool:
+        """过滤器树中（包括 AND/OR/NOT 内部）是否含有时间过滤器"""
+        return next(iter_time_filters(filters), None) is not None
 
-    def apply_filters(self, items: list[CrawlItem]) -> list[CrawlItem]:
+    def apply_filters(self, items: list[CrawlItem], time_context: TimeContext | None = None) -> list[CrawlItem]:
         """
         按顺序应用过滤器链；如果未配置过滤器，则回退到旧的关键词过滤逻辑。
+        
+        各过滤器通过 stream() 串成生成器管道，条目一次性流过整条链，
+        不在阶段之间生成临时列表。
+        
+        Args:
+            items: 条目列表
+            time_context: 本轮爬取共用的时间上下文（可选），为 None 时在此创建，
+                链上的各时间过滤器共用同一个当前时间
         """
         if self.filters:
             from ..utils.logger import get_logger
-            from ..filters.time_filter import TimeRangeFilter
             logger = get_logger()
-            
-            # 打印过滤前的条目数量
-            initial_count = len(items)
-            logger.info(f"[过滤器] 过滤前获取到 {initial_count} 个条目")
-            
-            for flt in self.filters:
-                # 如果是时间过滤器，打印时间范围
-                if isinstance(flt, TimeRangeFilter):
-                    range_str = flt.get_range_str()
-                    logger.info(f"[时间过滤器] 时间范围: {range_str}")
-                
-                # 输出过滤器描述（如果有）
-                filter_name = flt.__class__.__name__
-                if hasattr(flt, 'description') and flt.description:
-                    logger.info(f"[过滤器] {filter_name}: {flt.description}")
-                
-                items = flt.apply(items)
-                # 打印每个过滤器应用后的条目数量
-                current_count = len(items)
-                logger.info(f"[过滤器] 应用 {filter_name} 后剩余 {current_count} 个条目")
-            
-            # 打印最终过滤后的条目数量
-            final_count = len(items)
-            logger.info(f"[过滤器] 过滤完成，最终保留 {final_count} 个条目（过滤掉 {initial_count - final_count} 个）")
-            return items
+            if time_context is None:
+                time_context = TimeContext()
+            # 嵌套在 AND/OR/NOT 中的时间过滤器通过 match() 判断，本轮过滤期间使用同一个时间上下文
+            with use_time_context(time_context):
+                return self._apply_filter_chain(items, time_context, logger)
 
         # 没有配置过滤器，使用旧的关键词过滤以保持向后兼容
         return self._filter_by_keywords_legacy(items)
 
+    def _apply_filter_chain(self, items: list[CrawlItem], time_context: TimeContext, logger) -> list[CrawlItem]:
+        """apply_filters 的实现：把过滤器链串成生成器管道并输出各阶段的统计日志"""
+        # 打印过滤前的条目数量
+        initial_count = len(items)
+        logger.info(f"[过滤器] 过滤前获取到 {initial_count} 个条目")
+        
+        # 只有 INFO 日志开启时才在阶段之间插入计数器
+        count_stages = logger.isEnabledFor(logging.INFO)
+        stage_counts = [0] * len(self.filters)
+        
+        stream: Iterable[CrawlItem] = items
+        for index, flt in enumerate(self.filters):
+            # 如果是时间过滤器，打印时间范围
+            is_time_filter = isinstance(flt, TimeRangeFilter)
+            if is_time_filter:
+                range_str = flt.get_range_str(time_context)
+                logger.info(f"[时间过滤器] 时间范围: {range_str}")
+            
+            # 输出过滤器描述（如果有）
+            filter_name = flt.__class__.__name__
+            if hasattr(flt, 'description') and flt.description:
+                logger.info(f"[过滤器] {filter_name}: {flt.description}")
+            
+            stream = flt.stream(stream, time_context) if is_time_filter else flt.stream(stream)
+            if count_stages:
+                stream = _count_stage(stream, stage_counts, index)
+        
+        items = list(stream)
+        
+        # 打印每个过滤器应用后的条目数量
+        if count_stages:
+            for flt, current_count in zip(self.filters, stage_counts):
+                logger.info(f"[过滤器] 应用 {flt.__class__.__name__} 后剩余 {current_count} 个条目")
+        
+        # 打印最终过滤后的条目数量
+        final_count = len(items)
+        logger.info(f"[过滤器] 过滤完成，最终保留 {final_count} 个条目（过滤掉 {initial_count - final_count} 个）")
+        return items
+
+    def _get_keyword_pattern(self) -> re.Pattern:
+        """
+        获取由所有关键词组成的合并正则（kw1|kw2|...）
+        
+        只在关键词列表变化时重新编译，一次扫描即可判断是否命中任一关键词；
+        同时刷新 self._keyword_pairs 中预先小写的关键词和 self._keyword_automaton。
+        """
+        keywords = tuple(self.site_config.keywords)
+        if self._keyword_pattern is None or self._keyword_pattern_key != keywords:
+            # 重复的关键词只保留一个（保持顺序），匹配结果本来就会去重
+            self._keyword_pairs = [(keyword, keyword.lower()) for keyword in dict.fromkeys(keywords)]
+            self._keyword_automaton = build_keyword_automaton(
+                [keyword_lower for _, keyword_lower in self._keyword_pairs]
+            )
+            self._keyword_pattern = re.compile(
+                '|'.join(re.escape(keyword_lower) for _, keyword_lower in self._keyword_pairs),
+                re.IGNORECASE
+            )
+            self._keyword_pattern_key = keywords
+        return self._keyword_pattern
+    
     def _filter_by_keywords_legacy(self, items: list[CrawlItem]) -> list[CrawlItem]:
         """旧的关键词过滤逻辑（用于向后兼容），未来可以逐步弃用。"""
         if not self.site_config.keywords:
             return items
         
+        keyword_pattern = self._get_keyword_pattern()
+        keyword_pairs = self._keyword_pairs
+        keyword_automaton = self._keyword_automaton
         filtered_items = []
         for item in items:
             # 检查标题和摘要中是否包含关键词
-            title = item.title.lower()
-            summary = item.summary.lower() if item.summary else ''
-            content = f"{title} {summary}"
+            content = item.search_blob
             
-            # 找出所有匹配的关键词
-            matched_keywords = []
-            for keyword in self.site_config.keywords:
-                if keyword.lower() in content:
-                    matched_keywords.append(keyword)
+            if keyword_automaton is not None:
+                # 关键词较多时，自动机一次扫描即找出所有匹配的关键词
+                matched_keywords = [keyword_pairs[index][0] for index in keyword_automaton.find(content)]
+            else:
+                # 先用合并正则快速排除不含任何关键词的条目（大多数条目在此被拒绝）
+                if not keyword_pattern.search(content):
+                    continue
+                
+                # 找出所有匹配的关键词
+                matched_keywords = [keyword for keyword, keyword_lower in keyword_pairs
+                                    if keyword_lower in content]
             
             # 如果包含任一关键词，则保留
             if matched_keywords:
                 # 将匹配的关键词存储到item中
                 if 'keywords' not in item.other_info:
                     item.other_info['keywords'] = []
-                # 合并关键词（去重）
+                # 合并关键词（去重，保持首次出现的顺序，结果在多次运行间稳定）
                 existing_keywords = item.other_info.get('keywords', [])
                 if isinstance(existing_keywords, str):
                     existing_keywords = [existing_keywords]
-                all_keywords = list(set(existing_keywords + matched_keywords))
+                all_keywords = list(dict.fromkeys(existing_keywords + matched_keywords))
                 item.other_info['keywords'] = all_keywords
                 filtered_items.append(item)
         
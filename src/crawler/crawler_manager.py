@@ -1,8 +1,21 @@
 """爬虫管理器"""
 
+import asyncio
+import inspect
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from typing import Type
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 from ..models.site_config import SiteConfig
+from ..models.crawl_result import CrawlResult
 from .base import BaseCrawler
+from .feed_parser import DEFAULT_PARSER
 from .rss_crawler import BaseRSSCrawler
 from .arxiv_crawler import ArXivRSSCrawler
 from .zhiyuan_crawler import ZhiyuanHTMLCrawler
@@ -22,6 +35,15 @@ class CrawlerManager:
         'rss': BaseRSSCrawler,
     }
     
+    # 批量爬取的并发参数：同时进行的爬取数、连接池总连接数、同一主机的并发连接数
+    # （同一主机最多 2 个并发连接，避免对单个站点造成压力）
+    max_concurrency: int = 8
+    connection_limit: int = 32
+    connection_limit_per_host: int = 2
+    
+    # 爬虫类是否支持 translator 参数（避免每次创建爬虫都调用 inspect.signature）
+    _translator_support: dict[Type[BaseCrawler], bool] = {}
+    
     @classmethod
     def register_crawler(cls, name: str, crawler_class: Type[BaseCrawler]):
         """
@@ -32,6 +54,25 @@ class CrawlerManager:
             crawler_class: 爬虫类
         """
         cls._crawler_registry[name.lower()] = crawler_class
+        # 注册时预先缓存是否支持 translator 参数
+        cls._supports_translator(crawler_class)
+    
+    @classmethod
+    def _supports_translator(cls, crawler_class: Type[BaseCrawler]) -> bool:
+        """
+        检查爬虫类的构造函数是否支持 translator 参数（结果按类缓存）
+        
+        Args:
+            crawler_class: 爬虫类
+            
+        Returns:
+            是否支持 translator 参数
+        """
+        supported = cls._translator_support.get(crawler_class)
+        if supported is None:
+            supported = 'translator' in inspect.signature(crawler_class.__init__).parameters
+            cls._translator_support[crawler_class] = supported
+        return supported
     
     @classmethod
     def get_crawler(cls, site_config: SiteConfig, translator=None) -> BaseCrawler:
@@ -50,9 +91,7 @@ class CrawlerManager:
         if site_name in cls._crawler_registry:
             crawler_class = cls._crawler_registry[site_name]
             # 检查爬虫类是否支持 translator 参数
-            import inspect
-            sig = inspect.signature(crawler_class.__init__)
-            if 'translator' in sig.parameters:
+            if cls._supports_translator(crawler_class):
                 return crawler_class(site_config, translator=translator)
             else:
                 return crawler_class(site_config)
@@ -66,6 +105,88 @@ class CrawlerManager:
         # 方法3: 默认使用 RSS 爬虫
         return BaseRSSCrawler(site_config, translator=translator)
     
+    @classmethod
+    async def crawl_all_async(
+        cls,
+        crawlers: list[BaseCrawler],
+        max_concurrency: int | None = None,
+        return_exceptions: bool = False,
+    ) -> list[CrawlResult | BaseException]:
+        """
+        并发执行多个爬虫（主程序的单次运行和持续运行模式都通过这里爬取）
+        
+        安装了 aiohttp 时，所有爬虫共享一个 ClientSession（连接池）在事件循环中下载；
+        否则各爬虫在线程中运行同步的 crawl()。
+        
+        Args:
+            crawlers: 爬虫实例列表（已设置好过滤器）
+            max_concurrency: 同时进行的最大爬取数，为 None 时使用 cls.max_concurrency
+            return_exceptions: 为 True 时，爬虫抛出的异常作为结果返回，不影响其他爬虫
+            
+        Returns:
+            爬取结果列表（与 crawlers 顺序一致）
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or cls.max_concurrency)
+        
+        async def _crawl(crawler: BaseCrawler, session) -> CrawlResult:
+            async with semaphore:
+                return await crawler.crawl_async(session)
+        
+        # 只有使用纯 Python feedparser 的爬虫需要进程池
+        rss_crawlers = [
+            crawler for crawler in crawlers
+            if isinstance(crawler, BaseRSSCrawler) and crawler.feed_parser == DEFAULT_PARSER
+        ]
+        executor = cls._create_parse_executor(len(rss_crawlers))
+        if executor is not None:
+            for crawler in rss_crawlers:
+                crawler.parse_executor = executor
+        try:
+            if aiohttp is None:
+                return list(await asyncio.gather(
+                    *(_crawl(crawler, None) for crawler in crawlers),
+                    return_exceptions=return_exceptions,
+                ))
+            connector = aiohttp.TCPConnector(
+                limit=cls.connection_limit,
+                limit_per_host=cls.connection_limit_per_host,
+            )
+            async with aiohttp.ClientSession(connector=connector) as session:
+                return list(await asyncio.gather(
+                    *(_crawl(crawler, session) for crawler in crawlers),
+                    return_exceptions=return_exceptions,
+                ))
+        finally:
+            if executor is not None:
+                for crawler in rss_crawlers:
+                    crawler.parse_executor = None
+                executor.shutdown()
+    
+    @staticmethod
+    def _create_parse_executor(feed_count: int) -> ProcessPoolExecutor | None:
+        """
+        为批量 RSS 解析创建进程池
+        
+        只有纯 Python 的 feedparser 受 GIL 限制；feedparser_rs / fastfeedparser
+        在解析时会释放 GIL，线程并发即可，无需进程池。
+        
+        Args:
+            feed_count: 使用 feedparser 解析的 RSS feed 数量
+            
+        Returns:
+            进程池，不需要时返回 None
+        """
+        # 按本进程可用的 CPU 数计算（容器或 taskset 限制 CPU 时小于 os.cpu_count()），
+        # sched_getaffinity 只在 Linux 上提供
+        if sys.platform == "linux":
+            cpu_count = len(os.sched_getaffinity(0))
+        else:
+            cpu_count = os.cpu_count() or 1
+        max_workers = min(feed_count, cpu_count)
+        if max_workers < 2:
+            return None
+        return ProcessPoolExecutor(max_workers=max_workers)
+    
     @classmethod
     def list_registered_crawlers(cls) -> dict[str, str]:
         """
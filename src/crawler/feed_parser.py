@@ -0,0 +1,97 @@
+"""RSS 解析后端选择
+
+默认使用 feedparser。规则配置中可以通过 custom_config.feed_parser 显式选用其他解析库：
+- feedparser_rs（Rust 实现）
+- fastfeedparser（基于 lxml）
+
+其他解析库不保证提供 feedparser 的全部字段（如 ArXiv 爬虫依赖的 dc_creator、
+arxiv_announce_type、published_parsed），也不做 HTML 清理（sanitize_html 等解析选项无效），
+只应在确认目标 feed 的提取结果一致后启用。配置的解析库未安装或不认识时回退到 feedparser。
+"""
+
+import importlib
+from functools import lru_cache
+from types import ModuleType
+from typing import Any
+
+import feedparser
+
+
+# 默认解析库
+DEFAULT_PARSER = 'feedparser'
+
+# 可以通过配置启用的其他解析库
+OPTIONAL_PARSERS = ('feedparser_rs', 'fastfeedparser')
+
+
+@lru_cache(maxsize=None)
+def _load_parser(name: str) -> ModuleType | None:
+    """导入解析库（结果缓存），未安装时返回 None"""
+    if name == DEFAULT_PARSER:
+        return feedparser
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def resolve_parser(name: str | None) -> str:
+    """
+    确定实际使用的解析库
+
+    Args:
+        name: 配置的解析库名称（可选）
+
+    Returns:
+        解析库名称；未配置、不认识或未安装时返回 DEFAULT_PARSER
+    """
+    if name in OPTIONAL_PARSERS and _load_parser(name) is not None:
+        return name
+    return DEFAULT_PARSER
+
+
+def parse_feed(source: Any, parser: str = DEFAULT_PARSER, **options: Any) -> Any:
+    """
+    使用指定的后端解析 RSS feed
+
+    Args:
+        source: feed 的 URL、XML 字符串或字节内容
+        parser: 解析库名称（应先经过 resolve_parser 确认可用）
+        **options: feedparser 的解析选项（如 sanitize_html、resolve_relative_uris），
+            只有 feedparser 支持
+
+    Returns:
+        解析结果（feedparser.FeedParserDict 或兼容对象），保证带有 bozo 属性
+    """
+    if parser == DEFAULT_PARSER:
+        return feedparser.parse(source, **options)
+    feed = _load_parser(parser).parse(source)
+    # fastfeedparser 解析失败时直接抛异常，不提供 bozo 字段，这里补齐
+    if not hasattr(feed, 'bozo'):
+        try:
+            feed['bozo'] = False
+        except TypeError:
+            setattr(feed, 'bozo', False)
+    return feed
+
+
+def parse_feed_in_worker(source: Any, parser: str = DEFAULT_PARSER, **options: Any) -> Any:
+    """
+    供进程池调用的解析入口（必须是模块顶层函数，才能被 pickle 到子进程）
+
+    bozo_exception（如 SAXParseException）可能持有已关闭的文件句柄而无法 pickle，
+    这里替换为只保留错误信息的普通异常，主进程中的错误日志内容不变。
+
+    Args:
+        source: feed 的 XML 字符串或字节内容
+        parser: 解析库名称
+        **options: 传给 parse_feed 的解析选项
+
+    Returns:
+        可 pickle 的解析结果
+    """
+    feed = parse_feed(source, parser, **options)
+    exc = feed.get('bozo_exception') if isinstance(feed, dict) else None
+    if exc is not None:
+        feed['bozo_exception'] = RuntimeError(str(exc))
+    return feed
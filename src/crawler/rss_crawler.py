@@ -1,18 +1,55 @@
 """RSS 爬虫基类实现"""
 
-import feedparser
-from datetime import datetime, timedelta
-from typing import Any
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Callable
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
 from .base import BaseCrawler
+from .feed_parser import DEFAULT_PARSER, parse_feed, parse_feed_in_worker, resolve_parser
 from ..models.crawl_result import CrawlResult
 from ..models.crawl_item import CrawlItem
 from ..models.site_config import SiteConfig
+from ..filters.time_filter import TimeContext
+
+
+# 进程内的 HTTP 缓存验证信息（状态文件路径 -> {url, etag, last_modified}），
+# 持续轮询时只在首次读取状态文件，之后直接使用内存中的副本
+_HTTP_STATE_CACHE: dict[str, dict] = {}
+
+# 最近解析过的 feed（(URL, 内容摘要, 解析选项) -> 解析结果）。服务器不支持条件请求、
+# 或轮询快于 feed 更新时会反复下载到相同的内容，命中时直接复用解析结果，跳过 XML 解析
+_PARSED_FEED_CACHE: OrderedDict[tuple, Any] = OrderedDict()
+_PARSED_FEED_CACHE_SIZE = 64
+_PARSED_FEED_CACHE_LOCK = threading.Lock()
 
 
 class BaseRSSCrawler(BaseCrawler):
     """RSS 爬虫基类，提供通用的 RSS 解析功能"""
     
+    # 未重写任何 extract_* 方法时，parse_entry 在一个函数内读取全部字段（见 __init_subclass__）
+    _fused_parse_entry = True
+    
+    def __init_subclass__(cls, **kwargs):
+        """子类重写了任一 extract_* 方法时，parse_entry 回退到逐个调用 extract_* 的通用实现"""
+        super().__init_subclass__(**kwargs)
+        cls._fused_parse_entry = all(
+            getattr(cls, name) is getattr(BaseRSSCrawler, name)
+            for name in ('extract_published_time', 'extract_title', 'extract_link', 'extract_other_info')
+        )
+    
     def __init__(self, site_config: SiteConfig, translator=None):
         """
         初始化 RSS 爬虫
@@ -24,11 +61,71 @@ class BaseRSSCrawler(BaseCrawler):
         super().__init__(site_config)
         self.update_frequency_hours = site_config.update_frequency / 60  # 转换为小时
         self.translator = translator
+        # 本次下载得到的 ETag / Last-Modified，结果导出成功后才写入状态文件
+        self._pending_http_state: dict | None = None
+        # 解析用的进程池（由 CrawlerManager 在批量爬取时设置），为 None 时在当前线程解析
+        self.parse_executor: Executor | None = None
+        # RSS 解析库：默认 feedparser，可通过 custom_config.feed_parser 显式选用其他解析库
+        configured_parser = site_config.custom_config.get('feed_parser')
+        self.feed_parser = resolve_parser(configured_parser)
+        if configured_parser and configured_parser != self.feed_parser:
+            from ..utils.logger import get_logger
+            get_logger().warning(
+                "[RSS 抓取] 解析库 %s 不可用（未安装或不支持），使用 %s", configured_parser, self.feed_parser
+            )
     
     def crawl(self) -> CrawlResult:
         """
         执行 RSS 爬取
         
+        本次下载得到的 ETag / Last-Modified 只暂存在爬虫上，由调用方在结果导出成功后
+        通过 commit_crawl_state() 写入状态文件，避免导出失败的结果在下次轮询时因 304 而被跳过。
+        
+        Returns:
+            CrawlResult: 爬取结果
+        """
+        self._pending_http_state = None
+        return self._crawl_feed()
+    
+    async def crawl_async(self, session: Any = None) -> CrawlResult:
+        """
+        异步执行 RSS 爬取
+        
+        传入 aiohttp 会话时，在事件循环中下载 feed（多个站点共享连接池、互相重叠等待），
+        下载完成后再把解析和过滤交给线程执行；否则回退到在线程中运行 crawl()。
+        
+        Args:
+            session: aiohttp.ClientSession（可选）
+            
+        Returns:
+            CrawlResult: 爬取结果
+        """
+        if session is None or aiohttp is None:
+            return await super().crawl_async(session)
+        
+        self._pending_http_state = None
+        content: bytes | None = None
+        fetch_error: Exception | None = None
+        try:
+            content = await self.fetch_feed_async(session)
+        except Exception as e:
+            fetch_error = e
+        
+        def fetch() -> bytes | None:
+            # 下载异常在 _crawl_feed 内重新抛出，与同步路径的错误处理保持一致
+            if fetch_error is not None:
+                raise fetch_error
+            return content
+        
+        return await asyncio.to_thread(self._crawl_feed, fetch)
+    
+    def _crawl_feed(self, fetch: Callable[[], bytes | None] | None = None) -> CrawlResult:
+        """
+        执行 RSS 爬取的完整流程（下载、解析、过滤、翻译）
+        
+        Args:
+            fetch: 获取 feed 内容的函数（可选），默认为 self.fetch_feed
+        
         Returns:
             CrawlResult: 爬取结果
         """
@@ -38,18 +135,32 @@ class BaseRSSCrawler(BaseCrawler):
         
         try:
             # 开始抓取，立即输出信息
-            logger.info(f"[RSS 抓取] 开始抓取 RSS feed: {self.site_config.url}")
-            logger.info(f"[RSS 抓取] 站点: {self.site_config.name}")
+            logger.info("[RSS 抓取] 开始抓取 RSS feed: %s", self.site_config.url)
+            logger.info("[RSS 抓取] 站点: %s", self.site_config.name)
+            
+            # 下载 RSS feed（网络 I/O，与解析分离，便于并发抓取）
+            content = (fetch or self.fetch_feed)()
+            
+            # 条件请求命中（HTTP 304）：feed 没有变化，跳过解析
+            if content is None:
+                logger.info("[RSS 抓取] feed 未更新（HTTP 304），跳过解析")
+                return CrawlResult(
+                    site_name=self.site_config.name,
+                    crawl_time=crawl_time,
+                    items_count=0,
+                    success=True,
+                    error_message="RSS feed 未更新（HTTP 304）"
+                )
             
             # 解析 RSS feed
             # feedparser 完全支持标准的 RSS 2.0 格式（包含 <channel> 标签）
             # RSS 2.0 标准结构：<rss><channel><item>...</item></channel></rss>
             # feedparser 会自动解析 <channel> 中的 <item> 元素到 feed.entries
-            feed = feedparser.parse(self.site_config.url)
+            feed = self.parse_feed(content)
             
             if feed.bozo:
                 error_msg = f"RSS 解析错误: {feed.bozo_exception if hasattr(feed, 'bozo_exception') else '未知错误'}"
-                logger.error(f"[RSS 抓取] {error_msg}")
+                logger.error("[RSS 抓取] %s", error_msg)
                 return CrawlResult(
                     site_name=self.site_config.name,
                     crawl_time=crawl_time,
@@ -96,76 +207,78 @@ class BaseRSSCrawler(BaseCrawler):
                 )
             
             entries_count = len(feed.entries)
-            logger.info(f"[RSS 抓取] 找到 {entries_count} 个原始条目")
-            
-            # 检查是否配置了时间过滤器（递归检查嵌套的过滤器）
-            def has_time_filter_recursive(filters_list):
-                """递归检查过滤器中是否包含时间过滤器"""
-                from ..filters.time_filter import TimeRangeFilter
-                for flt in filters_list:
-                    if isinstance(flt, TimeRangeFilter):
-                        return True
-                    # 检查嵌套的过滤器（如 OR/AND/NOT 中的时间过滤器）
-                    if hasattr(flt, 'filters'):
-                        if has_time_filter_recursive(getattr(flt, 'filters', [])):
-                            return True
-                    # 检查 NOT 过滤器中的子过滤器
-                    if hasattr(flt, 'flt'):
-                        if isinstance(getattr(flt, 'flt', None), TimeRangeFilter):
-                            return True
-                return False
+            logger.info("[RSS 抓取] 找到 %d 个原始条目", entries_count)
             
-            has_time_filter = False
-            if self.filters:
-                has_time_filter = has_time_filter_recursive(self.filters)
+            # 是否配置了时间过滤器（包括嵌套的过滤器），在 set_filters 时已计算
+            has_time_filter = self._has_time_filter
             
             # 如果配置了时间过滤器，跳过初步时间过滤，让时间过滤器处理
             # 否则使用 update_frequency 进行初步过滤
             items: list[CrawlItem] = []
+            # 条目循环中频繁调用的方法先绑定到局部变量，省去每次的属性查找
+            extract_published_time = self.extract_published_time
+            parse_entry = self.parse_entry
+            append_item = items.append
+            # 每个条目的发布时间只解析一次，主循环和下方的预览共用
+            entry_times: list[tuple[Any, datetime | None]] = []
+            # 提前淘汰判断和过滤器链共用同一个"当前时间"
+            time_context = TimeContext()
             if has_time_filter:
+                entry_times = [(entry, extract_published_time(entry)) for entry in feed.entries]
                 logger.info("[RSS 抓取] 检测到时间过滤器，跳过初步时间过滤，由时间过滤器处理")
+                # 顶层时间过滤器必然淘汰的条目在提取摘要/作者等字段前直接跳过
+                fast_reject = self.build_fast_reject(time_context)
                 # 提取所有条目，让时间过滤器来处理
-                for entry in feed.entries:
-                    published_time = self.extract_published_time(entry)
+                for entry, published_time in entry_times:
                     if published_time:  # 只要有发布时间就保留，让过滤器处理
-                        item = self.parse_entry(entry)
+                        item = parse_entry(entry, published_time, fast_reject)
                         if item:
-                            items.append(item)
+                            append_item(item)
             else:
                 # 计算时间范围（过去 N 小时）
                 time_threshold = crawl_time - timedelta(hours=self.update_frequency_hours)
-                logger.info(f"[RSS 抓取] 时间阈值: {time_threshold.strftime('%Y-%m-%d %H:%M:%S')} (过去 {self.update_frequency_hours} 小时)")
+                logger.info("[RSS 抓取] 时间阈值: %s (过去 %s 小时)", time_threshold.strftime('%Y-%m-%d %H:%M:%S'), self.update_frequency_hours)
+                
+                # feed 的条目按发布时间从新到旧排列时（custom_config.entries_sorted_desc），
+                # 遇到第一个早于阈值的条目即可停止，其后的条目不再解析
+                entries_sorted_desc = self.site_config.custom_config.get('entries_sorted_desc', False)
+                append_entry_time = entry_times.append
                 
                 # 提取条目
                 # feed.entries 包含所有 <channel> 中的 <item> 元素
                 for entry in feed.entries:
-                    # 解析发布时间
-                    published_time = self.extract_published_time(entry)
-                    
+                    published_time = extract_published_time(entry)
+                    append_entry_time((entry, published_time))
+                    if not published_time:
+                        continue
                     # 只保留时间范围内的条目
-                    if published_time and published_time >= time_threshold:
-                        item = self.parse_entry(entry)
-                        if item:
-                            items.append(item)
+                    if published_time < time_threshold:
+                        if entries_sorted_desc:
+                            break
+                        continue
+                    item = parse_entry(entry, published_time)
+                    if item:
+                        append_item(item)
             
-            logger.info(f"[RSS 抓取] 初步处理后剩余 {len(items)} 个条目")
+            logger.info("[RSS 抓取] 初步处理后剩余 %d 个条目", len(items))
             
             # 如果初步处理后没有条目（可能是所有条目都没有发布时间），提前输出并返回
             if len(items) == 0:
-                logger.warning(f"[RSS 抓取] 初步处理后没有符合条件的条目（可能所有条目都没有发布时间）")
-                # 输出前几个原始条目供参考
-                logger.info("[RSS 抓取] 前几个原始条目预览（供参考）:")
-                preview_count = min(3, entries_count)
-                if feed.entries:
+                logger.warning("[RSS 抓取] 初步处理后没有符合条件的条目（可能所有条目都没有发布时间）")
+                # 输出前几个原始条目供参考（只在 INFO 级别启用时整理预览内容）
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("[RSS 抓取] 前几个原始条目预览（供参考）:")
+                    preview_count = min(3, entries_count)
                     for i, entry in enumerate(feed.entries[:preview_count], 1):
+                        # 提前停止时后面的条目尚未解析发布时间
+                        pub_time = entry_times[i - 1][1] if i <= len(entry_times) else extract_published_time(entry)
                         title = entry.get('title', '无标题') or '无标题'
                         link = entry.get('link', '')
-                        pub_time = self.extract_published_time(entry)
                         pub_str = pub_time.strftime('%Y-%m-%d %H:%M:%S') if pub_time else '无法解析'
                         title_preview = title[:50] if len(title) > 50 else title
-                        logger.info(f"  {i}. [{title_preview}{'...' if len(title) > 50 else ''}]")
-                        logger.info(f"     发布时间: {pub_str}")
-                        logger.info(f"     链接: {link}")
+                        logger.info("  %d. [%s%s]", i, title_preview, '...' if len(title) > 50 else '')
+                        logger.info("     发布时间: %s", pub_str)
+                        logger.info("     链接: %s", link)
                 return CrawlResult(
                     site_name=self.site_config.name,
                     crawl_time=crawl_time,
@@ -175,44 +288,45 @@ class BaseRSSCrawler(BaseCrawler):
                 )
             
             # 过滤器链处理（标题/摘要/作者/时间等），如果未配置则回退到关键词过滤
-            logger.info(f"[RSS 抓取] 开始应用过滤器...")
-            filtered_items = self.apply_filters(items)
-            logger.info(f"[RSS 抓取] 过滤器处理后剩余 {len(filtered_items)} 个条目")
+            logger.info("[RSS 抓取] 开始应用过滤器...")
+            filtered_items = self.apply_filters(items, time_context)
+            logger.info("[RSS 抓取] 过滤器处理后剩余 %d 个条目", len(filtered_items))
             
             # 转换为字典列表（用于 CrawlResult）
-            items_dict = [item.to_dict() for item in filtered_items]
+            items_dict = CrawlItem.to_dict_batch(filtered_items)
             
             # 应用翻译（如果启用了翻译器）
             if self.translator and self.translator.enabled:
-                logger.info(f"[翻译] 开始翻译 {len(items_dict)} 个条目的标题和摘要...")
-                translated_count = 0
-                for item_dict in items_dict:
-                    translated_item = self.translator.translate_item(item_dict)
-                    if 'title_zh' in translated_item or 'summary_zh' in translated_item:
-                        translated_count += 1
-                    # 更新原始字典
-                    item_dict.update(translated_item)
-                logger.info(f"[翻译] 完成翻译，成功翻译 {translated_count} 个条目")
+                logger.info("[翻译] 开始翻译 %d 个条目的标题和摘要...", len(items_dict))
+                # 所有条目的标题和摘要合并为批量请求，避免逐条翻译的网络往返；
+                # items_dict 是刚创建的字典，直接写入翻译结果，不再逐个复制
+                items_dict = self.translator.translate_items(items_dict, in_place=True)
+                translated_count = sum(
+                    1 for item_dict in items_dict
+                    if 'title_zh' in item_dict or 'summary_zh' in item_dict
+                )
+                logger.info("[翻译] 完成翻译，成功翻译 %d 个条目", translated_count)
             
             # 检查是否成功爬取到条目
             items_count = len(filtered_items)
             
             if items_count > 0:
                 # 如果爬取到了，输出前几个条目
-                logger.info(f"[RSS 抓取] ✓ 成功爬取到 {items_count} 个条目")
-                logger.info("[RSS 抓取] 前几个条目预览:")
-                preview_count = min(5, items_count)  # 最多显示5个
-                for i, item_dict in enumerate(items_dict[:preview_count], 1):
-                    title = item_dict.get('title', '无标题')
-                    link = item_dict.get('link', '')
-                    published_time_str = item_dict.get('published_time_str', '')
-                    logger.info(f"  {i}. [{title[:60]}{'...' if len(title) > 60 else ''}]")
-                    logger.info(f"     链接: {link}")
-                    logger.info(f"     发布时间: {published_time_str}")
+                logger.info("[RSS 抓取] ✓ 成功爬取到 %d 个条目", items_count)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("[RSS 抓取] 前几个条目预览:")
+                    preview_count = min(5, items_count)  # 最多显示5个
+                    for i, item_dict in enumerate(items_dict[:preview_count], 1):
+                        title = item_dict.get('title', '无标题')
+                        link = item_dict.get('link', '')
+                        published_time_str = item_dict.get('published_time_str', '')
+                        logger.info("  %d. [%s%s]", i, title[:60], '...' if len(title) > 60 else '')
+                        logger.info("     链接: %s", link)
+                        logger.info("     发布时间: %s", published_time_str)
             else:
                 # 如果没有爬取到，报错
                 error_msg = f"爬取失败：未能获取到任何条目（站点: {self.site_config.name}, URL: {self.site_config.url}）"
-                logger.error(f"[RSS 抓取] ✗ {error_msg}")
+                logger.error("[RSS 抓取] ✗ %s", error_msg)
                 return CrawlResult(
                     site_name=self.site_config.name,
                     crawl_time=crawl_time,
@@ -230,7 +344,7 @@ class BaseRSSCrawler(BaseCrawler):
             )
             
         except Exception as e:
-            logger.error(f"[RSS 抓取] ✗ 爬取过程中发生异常: {str(e)}", exc_info=True)
+            logger.error("[RSS 抓取] ✗ 爬取过程中发生异常: %s", e, exc_info=True)
             return CrawlResult(
                 site_name=self.site_config.name,
                 crawl_time=crawl_time,
@@ -239,6 +353,206 @@ class BaseRSSCrawler(BaseCrawler):
                 error_message=f"爬取失败: {str(e)}"
             )
     
+    def fetch_feed(self) -> bytes | None:
+        """
+        下载 RSS feed 的原始内容
+        
+        默认使用条件请求（If-None-Match / If-Modified-Since），
+        可在规则的 custom_config 中设置 conditional_get: false 关闭。
+        
+        Returns:
+            feed 的字节内容（由解析库自行检测编码）；服务器返回 304 时为 None
+        """
+        response = self.http_session.get(self.site_config.url, headers=self._build_request_headers(), timeout=30)
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
+        self._remember_http_validators(response.headers)
+        return response.content
+    
+    async def fetch_feed_async(self, session: Any) -> bytes | None:
+        """
+        使用 aiohttp 会话下载 RSS feed 的原始内容（条件请求规则与 fetch_feed 相同）
+        
+        Args:
+            session: aiohttp.ClientSession
+            
+        Returns:
+            feed 的字节内容；服务器返回 304 时为 None
+        """
+        timeout = aiohttp.ClientTimeout(total=30)
+        async with session.get(self.site_config.url, headers=self._build_request_headers(), timeout=timeout) as response:
+            if response.status == 304:
+                return None
+            response.raise_for_status()
+            content = await response.read()
+            self._remember_http_validators(response.headers)
+            return content
+    
+    def _build_request_headers(self) -> dict[str, str]:
+        """根据上次成功爬取的状态构造条件请求头（未启用 conditional_get 时为空）"""
+        headers = {}
+        if self.site_config.custom_config.get('conditional_get', True):
+            state = self._load_http_state()
+            # 过滤条件变化后上次被过滤掉的条目可能需要保留，此时不发送条件请求
+            if state.get('url') == self.site_config.url and state.get('filters') == self._filters_digest():
+                if state.get('etag'):
+                    headers['If-None-Match'] = state['etag']
+                if state.get('last_modified'):
+                    headers['If-Modified-Since'] = state['last_modified']
+        return headers
+    
+    def _remember_http_validators(self, response_headers) -> None:
+        """记录响应中的 ETag / Last-Modified，结果导出成功后由 commit_crawl_state 写入"""
+        if not self.site_config.custom_config.get('conditional_get', True):
+            return
+        etag = response_headers.get('ETag')
+        last_modified = response_headers.get('Last-Modified')
+        if etag or last_modified:
+            self._pending_http_state = {
+                'url': self.site_config.url,
+                'filters': self._filters_digest(),
+                'etag': etag,
+                'last_modified': last_modified,
+            }
+    
+    def _filters_digest(self) -> str:
+        """过滤条件（过滤器链配置和旧的关键词列表）的摘要，随 ETag 一起保存"""
+        key = json.dumps([self.filters_key, list(self.site_config.keywords)], ensure_ascii=False)
+        return hashlib.blake2b(key.encode('utf-8'), digest_size=8).hexdigest()
+    
+    def _get_http_state_path(self) -> Path:
+        """获取保存 ETag / Last-Modified 的状态文件路径（state/<site>.json）"""
+        state_dir = self.site_config.custom_config.get('state_dir', 'state')
+        return Path(state_dir) / f"{self.site_config.name}.json"
+    
+    def _load_http_state(self) -> dict:
+        """读取上次成功爬取时的 HTTP 缓存验证信息（优先使用进程内缓存）"""
+        state_path = self._get_http_state_path()
+        cache_key = str(state_path)
+        if cache_key in _HTTP_STATE_CACHE:
+            return _HTTP_STATE_CACHE[cache_key]
+        state = {}
+        if state_path.exists():
+            try:
+                with open(state_path, 'r', encoding='utf-8') as f:
+                    loaded = json.load(f)
+                if isinstance(loaded, dict):
+                    state = loaded
+            except Exception:
+                pass
+        _HTTP_STATE_CACHE[cache_key] = state
+        return state
+    
+    def commit_crawl_state(self):
+        """
+        保存本次下载得到的 HTTP 缓存验证信息（如果有）
+        
+        应在爬取结果导出成功后调用；未调用时下次仍会完整下载 feed。
+        """
+        if not self._pending_http_state:
+            return
+        state_path = self._get_http_state_path()
+        _HTTP_STATE_CACHE[str(state_path)] = self._pending_http_state
+        try:
+            state_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(state_path, 'w', encoding='utf-8') as f:
+                json.dump(self._pending_http_state, f, ensure_ascii=False, indent=2)
+        except Exception:
+            pass
+        self._pending_http_state = None
+    
+    def parse_feed(self, source: Any) -> Any:
+        """
+        解析 RSS feed（解析库由 self.feed_parser 指定）
+        
+        对字符串/字节内容按 (URL, 内容摘要) 缓存解析结果，内容未变化时不再重复解析。
+        
+        Args:
+            source: feed 的 URL、XML 字符串或字节内容
+            
+        Returns:
+            解析后的 feed 对象
+        """
+        parser = self.feed_parser
+        options = {}
+        if parser == DEFAULT_PARSER and not self.site_config.custom_config.get('sanitize_html', True):
+            # 下游只使用纯文本时，跳过 feedparser 对 summary/content 的 HTML 清理和相对链接解析
+            options = {'sanitize_html': False, 'resolve_relative_uris': False}
+        cache_key = None
+        if isinstance(source, (bytes, str)):
+            content = source.encode('utf-8') if isinstance(source, str) else source
+            cache_key = (
+                self.site_config.url,
+                hashlib.blake2b(content, digest_size=16).digest(),
+                parser,
+                tuple(sorted(options.items())),
+            )
+            with _PARSED_FEED_CACHE_LOCK:
+                feed = _PARSED_FEED_CACHE.get(cache_key)
+                if feed is not None:
+                    _PARSED_FEED_CACHE.move_to_end(cache_key)
+                    return feed
+        
+        if self.parse_executor is not None and cache_key is not None:
+            # 纯 Python 的 feedparser 受 GIL 限制，多个 feed 需在子进程中并行解析
+            feed = self.parse_executor.submit(parse_feed_in_worker, source, parser, **options).result()
+        else:
+            feed = parse_feed(source, parser, **options)
+        
+        if cache_key is not None:
+            with _PARSED_FEED_CACHE_LOCK:
+                _PARSED_FEED_CACHE[cache_key] = feed
+                if len(_PARSED_FEED_CACHE) > _PARSED_FEED_CACHE_SIZE:
+                    _PARSED_FEED_CACHE.popitem(last=False)
+        return feed
+    
+    def parse_entry(
+        self,
+        entry: Any,
+        published_time: datetime | None = None,
+        fast_reject: Callable[[datetime], bool] | None = None,
+    ) -> CrawlItem | None:
+        """
+        解析条目为 CrawlItem
+        
+        与 extract_title / extract_link / extract_other_info 的结果完全相同，
+        但在一个函数内完成，省去每个条目的多次方法调用。
+        
+        Args:
+            entry: RSS 条目
+            published_time: 调用方已提取的发布时间（可选）
+            fast_reject: 提前淘汰判断函数（可选）
+            
+        Returns:
+            CrawlItem 对象，如果解析失败或被提前淘汰返回 None
+        """
+        if not self._fused_parse_entry:
+            return super().parse_entry(entry, published_time, fast_reject)
+        try:
+            if published_time is None:
+                published_time = self.extract_published_time(entry)
+            if not published_time:
+                return None
+            if fast_reject is not None and fast_reject(published_time):
+                return None
+            
+            get = entry.get
+            link = get('link', '')
+            return CrawlItem(
+                title=get('title', '').strip(),
+                link=link,
+                published_time=published_time,
+                other_info={
+                    'summary': get('summary', get('description', '')).strip(),
+                    'id': get('id', link),
+                    'authors': self._extract_authors_generic(entry),
+                    'categories': self._extract_categories_generic(entry),
+                },
+            )
+        except Exception:
+            return None
+    
     def extract_published_time(self, entry: Any) -> datetime | None:
         """
         提取发布时间（RSS 通用方法）
@@ -250,19 +564,23 @@ class BaseRSSCrawler(BaseCrawler):
             datetime 对象，如果解析失败返回 None
         """
         try:
-            # feedparser 通常会将发布时间解析为 time.struct_time
-            # FeedParserDict 支持属性访问和字典访问
-            if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                return datetime(*entry.published_parsed[:6])
-            elif hasattr(entry, 'published'):
-                # 尝试解析字符串格式的时间
-                time_str = entry.published
-                # 处理常见的 RSS 时间格式
-                for fmt in ['%Y-%m-%dT%H:%M:%SZ', '%Y-%m-%dT%H:%M:%S%z', '%a, %d %b %Y %H:%M:%S %Z']:
-                    try:
-                        return datetime.strptime(time_str, fmt)
-                    except ValueError:
-                        continue
+            # feedparser 通常已将发布时间解析为 UTC 的 time.struct_time，直接构造 datetime 最快
+            # 注意：保持 naive datetime，与 TimeRangeFilter 等处的 datetime.now() 比较语义一致
+            published_parsed = entry.get('published_parsed')
+            if published_parsed:
+                return datetime(*published_parsed[:6])
+            time_str = entry.get('published')
+            if time_str:
+                # 根据开头是否为年份区分格式，直接交给 C 实现的解析函数，避免逐个格式试错：
+                # ISO 8601（Atom，如 2025-11-12T08:00:00Z）/ RFC 822（RSS，如 Wed, 12 Nov 2025 08:00:00 GMT）
+                if time_str[:4].isdigit():
+                    published = datetime.fromisoformat(time_str)
+                else:
+                    published = parsedate_to_datetime(time_str)
+                # 带时区的时间统一转换为 UTC 的 naive datetime，与 published_parsed 分支一致
+                if published.tzinfo is not None:
+                    published = published.astimezone(timezone.utc).replace(tzinfo=None)
+                return published
         except Exception:
             pass
         
@@ -320,21 +638,14 @@ class BaseRSSCrawler(BaseCrawler):
         Returns:
             作者列表
         """
-        authors = []
-        
-        # 检查标准的 authors 字段
-        if hasattr(entry, 'authors') and entry.authors:
-            authors = [author.get('name', '') if isinstance(author, dict) else str(author) 
-                       for author in entry.authors]
-        # 检查 author 字段（单个）
-        elif hasattr(entry, 'author') and entry.author:
-            authors = [entry.author]
-        # 从字典中获取
-        elif isinstance(entry, dict):
-            if 'authors' in entry:
-                authors = entry['authors']
-            elif 'author' in entry:
-                authors = [entry['author']]
+        # FeedParserDict 是 dict 子类，直接 get() 即可，避免 hasattr 走 __getattr__ 的回退路径
+        authors = entry.get('authors')
+        if authors:
+            authors = [author.get('name', '') if isinstance(author, dict) else str(author)
+                       for author in authors]
+        else:
+            author = entry.get('author')
+            authors = [author] if author else []
         
         # 清理作者名称
         cleaned_authors = [author.strip() for author in authors if author and author.strip()]
@@ -350,27 +661,20 @@ class BaseRSSCrawler(BaseCrawler):
         Returns:
             分类列表
         """
-        categories = []
-        
         # 检查 tags 字段（feedparser 标准格式）
-        if hasattr(entry, 'tags') and entry.tags:
+        tags = entry.get('tags')
+        if tags:
             categories = [tag.get('term', '') if isinstance(tag, dict) else str(tag)
-                         for tag in entry.tags]
-        # 检查 category 字段
-        elif hasattr(entry, 'category') and entry.category:
-            if isinstance(entry.category, list):
-                categories = [str(cat) for cat in entry.category]
+                          for tag in tags]
+        else:
+            # 检查 category 字段
+            category = entry.get('category')
+            if not category:
+                categories = []
+            elif isinstance(category, list):
+                categories = [str(cat) for cat in category]
             else:
-                categories = [str(entry.category)]
-        # 从字典中获取
-        elif isinstance(entry, dict):
-            if 'tags' in entry:
-                tags = entry['tags']
-                categories = [tag.get('term', '') if isinstance(tag, dict) else str(tag)
-                           for tag in tags]
-            elif 'category' in entry:
-                cat = entry['category']
-                categories = [cat] if isinstance(cat, str) else [str(c) for c in cat]
+                categories = [str(category)]
         
         # 清理分类名称
         cleaned_categories = [cat.strip() for cat in categories if cat and cat.strip()]
@@ -1,13 +1,138 @@
 """智源社区 HTML 爬虫实现"""
 
+import asyncio
 import re
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
+from typing import Any, Callable, Iterator
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
 
 from .base import BaseCrawler
 from ..models.site_config import SiteConfig
 from ..models.crawl_result import CrawlResult
+from ..models.crawl_item import CrawlItem
+
+
+# 请求网页时使用的请求头
+_REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# 中文日期，如 "2025年11月17日"
+_DATE_RE = re.compile(r'(\d{4})年(\d{1,2})月(\d{1,2})日')
+# 论文链接中的智源社区 ID，如 /paper/e9847a14-bb0f-4a32-9411-351d0b502838
+_PAPER_ID_RE = re.compile(r'/paper/([a-f0-9\-]+)')
+
+# 简单 CSS 选择器：tag.class、tag[attr] 或 [attr]
+_SIMPLE_SELECTOR_RE = re.compile(r'^([a-z0-9]*)(?:\.([\w-]+)|\[([\w-]+)\])$')
+
+# 条目元素可能是 selectolax 的节点、lxml 的元素或 BeautifulSoup 的 Tag（取决于安装的解析库），
+# 以下辅助函数统一三者的 CSS 查找、文本和属性读取，extract_* 方法不区分解析后端
+
+def _is_lxml_element(element) -> bool:
+    return etree is not None and isinstance(element, etree._Element)
+
+
+@lru_cache(maxsize=None)
+def _css_to_xpath(selector: str) -> str:
+    """将本模块用到的简单 CSS 选择器转换为等价的 XPath（lxml 未安装 cssselect 时使用）"""
+    match = _SIMPLE_SELECTOR_RE.match(selector)
+    if not match:
+        raise ValueError(f"不支持的选择器: {selector}")
+    tag, class_name, attr = match.groups()
+    tag = tag or '*'
+    if class_name:
+        return f".//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+    return f".//{tag}[@{attr}]"
+
+
+def _select_one(element, selector: str):
+    """查找第一个匹配 CSS 选择器的子元素，没有时返回 None"""
+    if isinstance(element, Tag):
+        return element.select_one(selector)
+    if _is_lxml_element(element):
+        found = element.xpath(_css_to_xpath(selector))
+        return found[0] if found else None
+    # selectolax 的 css / css_first 也会匹配元素本身，与 BeautifulSoup / lxml 不同，需要跳过
+    root_id = element.mem_id
+    return next((node for node in element.css(selector) if node.mem_id != root_id), None)
+
+
+def _select_all(element, selector: str) -> list:
+    """查找所有匹配 CSS 选择器的子元素"""
+    if isinstance(element, Tag):
+        return element.select(selector)
+    if _is_lxml_element(element):
+        return element.xpath(_css_to_xpath(selector))
+    root_id = element.mem_id
+    return [node for node in element.css(selector) if node.mem_id != root_id]
+
+
+def _get_text(element) -> str:
+    """获取元素的文本（各文本片段去除首尾空白后拼接）"""
+    if isinstance(element, Tag):
+        return element.get_text(strip=True)
+    if _is_lxml_element(element):
+        return ''.join(text.strip() for text in element.itertext())
+    return element.text(strip=True)
+
+
+def _get_attr(element, name: str) -> str:
+    """获取元素的属性值，不存在时返回空字符串"""
+    if isinstance(element, Tag):
+        # BeautifulSoup 中多值属性（如 class）是列表
+        value = element.get(name)
+        return value if isinstance(value, str) else ' '.join(value or ())
+    if _is_lxml_element(element):
+        return element.get(name) or ''
+    return element.attributes.get(name) or ''
+
+
+def _iter_paper_items(content: bytes) -> Iterator[Any]:
+    """
+    逐个产出网页中的论文条目元素（div.paper-item）
+    
+    按优先级选择解析方式：
+    1. selectolax（Lexbor 后端），在这类简单的标签/类名查找上比 BeautifulSoup 快一个数量级
+    2. lxml 的 iterparse 流式解析，每个条目处理完后即释放，内存占用不随页面大小增长
+    3. BeautifulSoup + html.parser
+    
+    Args:
+        content: 网页的字节内容（站点固定为 UTF-8）
+    """
+    if LexborHTMLParser is not None:
+        yield from LexborHTMLParser(content).css('div.paper-item')
+    elif etree is not None:
+        for _, element in etree.iterparse(
+            BytesIO(content), events=('end',), tag='div', html=True, encoding='utf-8'
+        ):
+            if 'paper-item' not in (element.get('class') or '').split():
+                continue
+            # 调用方在取下一个条目之前处理完当前条目，之后即可释放它和之前的兄弟节点
+            yield element
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+    else:
+        # 直接传入字节并指定编码，省去先解码为 str 和编码探测
+        soup = BeautifulSoup(content, 'html.parser', from_encoding='utf-8')
+        yield from soup.find_all('div', class_='paper-item')
 
 
 class ZhiyuanHTMLCrawler(BaseCrawler):
@@ -29,6 +154,76 @@ class ZhiyuanHTMLCrawler(BaseCrawler):
         """
         执行 HTML 爬取
         
+        Returns:
+            CrawlResult: 爬取结果
+        """
+        return self._crawl_page()
+    
+    async def crawl_async(self, session: Any = None) -> CrawlResult:
+        """
+        异步执行 HTML 爬取
+        
+        传入 aiohttp 会话时，在事件循环中下载网页（与其他站点共享连接池），
+        下载完成后再把解析和过滤交给线程执行；否则回退到在线程中运行 crawl()。
+        
+        Args:
+            session: aiohttp.ClientSession（可选）
+            
+        Returns:
+            CrawlResult: 爬取结果
+        """
+        if session is None or aiohttp is None:
+            return await super().crawl_async(session)
+        
+        # 网页下载没有条件请求，成功时必有内容；下载失败时 content 不会被使用
+        content = b''
+        fetch_error: Exception | None = None
+        try:
+            content = await self.fetch_page_async(session)
+        except Exception as e:
+            fetch_error = e
+        
+        def fetch() -> bytes:
+            # 下载异常在 _crawl_page 内重新抛出，与同步路径的错误处理保持一致
+            if fetch_error is not None:
+                raise fetch_error
+            return content
+        
+        return await asyncio.to_thread(self._crawl_page, fetch)
+    
+    def fetch_page(self) -> bytes:
+        """
+        下载网页的原始内容
+        
+        Returns:
+            网页的字节内容
+        """
+        response = self.http_session.get(self.site_config.url, headers=_REQUEST_HEADERS, timeout=30)
+        response.raise_for_status()
+        return response.content
+    
+    async def fetch_page_async(self, session: Any) -> bytes:
+        """
+        使用 aiohttp 会话下载网页的原始内容
+        
+        Args:
+            session: aiohttp.ClientSession
+            
+        Returns:
+            网页的字节内容
+        """
+        timeout = aiohttp.ClientTimeout(total=30)
+        async with session.get(self.site_config.url, headers=_REQUEST_HEADERS, timeout=timeout) as response:
+            response.raise_for_status()
+            return await response.read()
+    
+    def _crawl_page(self, fetch: Callable[[], bytes] | None = None) -> CrawlResult:
+        """
+        执行 HTML 爬取的完整流程（下载、解析、过滤、翻译）
+        
+        Args:
+            fetch: 获取网页内容的函数（可选），默认为 self.fetch_page
+        
         Returns:
             CrawlResult: 爬取结果
         """
@@ -42,22 +237,26 @@ class ZhiyuanHTMLCrawler(BaseCrawler):
             logger.info(f"[HTML 抓取] 站点: {self.site_config.name}")
             
             # 获取网页内容
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            response = requests.get(self.site_config.url, headers=headers, timeout=30)
-            response.raise_for_status()
-            response.encoding = 'utf-8'
+            content = (fetch or self.fetch_page)()
             
             logger.info("[HTML 抓取] 网页获取成功")
             
-            # 解析HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 查找所有论文条目（paper-item）
-            paper_items = soup.find_all('div', class_='paper-item')
+            # 逐个解析论文条目（paper-item）
+            items = []
+            raw_count = 0
+            for paper_item in _iter_paper_items(content):
+                raw_count += 1
+                try:
+                    # 将条目元素包装为字典格式，以便使用统一的 extract_* 方法
+                    entry = {'soup_element': paper_item}
+                    item = self.parse_entry(entry)
+                    if item:
+                        items.append(item)
+                except Exception as e:
+                    logger.warning(f"[HTML 抓取] 解析条目时出错: {e}")
+                    continue
             
-            if not paper_items:
+            if raw_count == 0:
                 logger.warning("[HTML 抓取] 未找到论文条目")
                 return CrawlResult(
                     site_name=self.site_config.name,
@@ -67,33 +266,7 @@ class ZhiyuanHTMLCrawler(BaseCrawler):
                     error_message="未找到论文条目"
                 )
             
-            logger.info(f"[HTML 抓取] 找到 {len(paper_items)} 个原始条目")
-            
-            # 检查是否配置了时间过滤器            
-            if self.filters:
-                from ..filters.time_filter import TimeRangeFilter
-                for flt in self.filters:
-                    if isinstance(flt, TimeRangeFilter):
-            
-                        break
-                    # 检查嵌套的过滤器
-                    if hasattr(flt, 'filters'):
-                        for sub_flt in getattr(flt, 'filters', []):
-                            if isinstance(sub_flt, TimeRangeFilter):
-                                break
-            
-            # 解析条目
-            items = []
-            for paper_item in paper_items:
-                try:
-                    # 将 BeautifulSoup 元素转换为字典格式，以便使用统一的 extract_* 方法
-                    entry = {'soup_element': paper_item}
-                    item = self.parse_entry(entry)
-                    if item:
-                        items.append(item)
-                except Exception as e:
-                    logger.warning(f"[HTML 抓取] 解析条目时出错: {e}")
-                    continue
+            logger.info(f"[HTML 抓取] 找到 {raw_count} 个原始条目")
             
             logger.info(f"[HTML 抓取] 初步处理后剩余 {len(items)} 个条目")
             
@@ -114,17 +287,18 @@ class ZhiyuanHTMLCrawler(BaseCrawler):
             logger.info(f"[HTML 抓取] 过滤器处理后剩余 {len(filtered_items)} 个条目")
             
             # 转换为字典列表
-            items_dict = [item.to_dict() for item in filtered_items]
+            items_dict = CrawlItem.to_dict_batch(filtered_items)
             
             # 应用翻译（如果启用了翻译器）
             if self.translator and self.translator.enabled:
                 logger.info(f"[翻译] 开始翻译 {len(items_dict)} 个条目的标题和摘要...")
-                translated_count = 0
-                for item_dict in items_dict:
-                    translated_item = self.translator.translate_item(item_dict)
-                    if 'title_zh' in translated_item or 'summary_zh' in translated_item:
-                        translated_count += 1
-                    item_dict.update(translated_item)
+                # 所有条目的标题和摘要合并为批量请求，避免逐条翻译的网络往返；
+                # items_dict 是刚创建的字典，直接写入翻译结果，不再逐个复制
+                items_dict = self.translator.translate_items(items_dict, in_place=True)
+                translated_count = sum(
+                    1 for item_dict in items_dict
+                    if 'title_zh' in item_dict or 'summary_zh' in item_dict
+                )
                 logger.info(f"[翻译] 完成翻译，成功翻译 {translated_count} 个条目")
             
             # 检查是否成功爬取到条目
@@ -170,27 +344,64 @@ class ZhiyuanHTMLCrawler(BaseCrawler):
                 error_message=f"爬取失败: {str(e)}"
             )
 
+    def parse_entry(
+        self,
+        entry: dict,
+        published_time: datetime | None = None,
+        fast_reject: Callable[[datetime], bool] | None = None,
+    ) -> CrawlItem | None:
+        """
+        解析条目为 CrawlItem
+        
+        与基类的通用实现相同，但链接只查找一次，并传给 extract_other_info 用于提取 ID。
+        
+        Args:
+            entry: 包含条目元素的字典
+            published_time: 调用方已提取的发布时间（可选）
+            fast_reject: 提前淘汰判断函数（可选）
+            
+        Returns:
+            CrawlItem 对象，如果解析失败或被提前淘汰返回 None
+        """
+        try:
+            if published_time is None:
+                published_time = self.extract_published_time(entry)
+            if not published_time:
+                return None
+            if fast_reject is not None and fast_reject(published_time):
+                return None
+            
+            link = self.extract_link(entry)
+            return CrawlItem(
+                title=self.extract_title(entry),
+                link=link,
+                published_time=published_time,
+                other_info=self.extract_other_info(entry, link)
+            )
+        except Exception:
+            return None
+    
     def extract_published_time(self, entry: dict) -> datetime | None:
         """
         提取发布时间
 
         Args:
-            entry: 包含 BeautifulSoup 元素的字典
+            entry: 包含条目元素（selectolax 节点或 BeautifulSoup 元素）的字典
             
         Returns:
             datetime 对象，如果解析失败返回 None
         """
         try:
             soup_element = entry.get('soup_element')
-            if not soup_element:
+            if soup_element is None:
                 return None
             
             # 查找发布时间元素
-            time_elem = soup_element.find('span', class_='paper-item-time')
-            if not time_elem:
+            time_elem = _select_one(soup_element, 'span.paper-item-time')
+            if time_elem is None:
                 return None
             
-            time_text = time_elem.get_text(strip=True)
+            time_text = _get_text(time_elem)
             if not time_text:
                 return None
             
@@ -199,7 +410,7 @@ class ZhiyuanHTMLCrawler(BaseCrawler):
             time_text = time_text.strip()
             
             # 尝试解析中文日期格式：2025年11月17日
-            match = re.search(r'(\d{4})年(\d{1,2})月(\d{1,2})日', time_text)
+            match = _DATE_RE.search(time_text)
             if match:
                 year = int(match.group(1))
                 month = int(match.group(2))
@@ -217,25 +428,25 @@ class ZhiyuanHTMLCrawler(BaseCrawler):
         提取标题
         
         Args:
-            entry: 包含 BeautifulSoup 元素的字典
+            entry: 包含条目元素（selectolax 节点或 BeautifulSoup 元素）的字典
             
         Returns:
             标题字符串
         """
         try:
             soup_element = entry.get('soup_element')
-            if not soup_element:
+            if soup_element is None:
                 return ''
             
             # 查找标题元素
-            title_elem = soup_element.find('h6', class_='paper-item-title')
-            if title_elem:
-                return title_elem.get_text(strip=True)
+            title_elem = _select_one(soup_element, 'h6.paper-item-title')
+            if title_elem is not None:
+                return _get_text(title_elem)
             
             # 备用：查找 title 属性
-            title_elem = soup_element.find(attrs={'title': True})
-            if title_elem:
-                return title_elem.get('title', '').strip()
+            title_elem = _select_one(soup_element, '[title]')
+            if title_elem is not None:
+                return _get_attr(title_elem, 'title').strip()
             
             return ''
         except Exception:
@@ -246,20 +457,20 @@ class ZhiyuanHTMLCrawler(BaseCrawler):
         提取链接
         
         Args:
-            entry: 包含 BeautifulSoup 元素的字典
+            entry: 包含条目元素（selectolax 节点或 BeautifulSoup 元素）的字典
             
         Returns:
             链接字符串
         """
         try:
             soup_element = entry.get('soup_element')
-            if not soup_element:
+            if soup_element is None:
                 return ''
             
             # 查找链接元素
-            link_elem = soup_element.find('a', href=True)
-            if link_elem:
-                href = link_elem.get('href', '')
+            link_elem = _select_one(soup_element, 'a[href]')
+            if link_elem is not None:
+                href = _get_attr(link_elem, 'href')
                 # 如果是相对路径，转换为绝对路径
                 if href.startswith('/'):
                     base_url = 'https://hub.baai.ac.cn'
@@ -270,12 +481,13 @@ class ZhiyuanHTMLCrawler(BaseCrawler):
         except Exception:
             return ''
     
-    def extract_other_info(self, entry: dict) -> dict:
+    def extract_other_info(self, entry: dict, link: str | None = None) -> dict:
         """
         提取其他信息（摘要、作者、分类等）
         
         Args:
-            entry: 包含 BeautifulSoup 元素的字典
+            entry: 包含条目元素（selectolax 节点或 BeautifulSoup 元素）的字典
+            link: 已提取的链接（可选），传入时不再重复查找链接元素
             
         Returns:
             其他信息的字典
@@ -289,35 +501,36 @@ class ZhiyuanHTMLCrawler(BaseCrawler):
         
         try:
             soup_element = entry.get('soup_element')
-            if not soup_element:
+            if soup_element is None:
                 return other_info
             
             # 提取摘要
-            summary_elem = soup_element.find('div', class_='paper-item-summary')
-            if summary_elem:
-                summary_text = summary_elem.get_text(strip=True)
+            summary_elem = _select_one(soup_element, 'div.paper-item-summary')
+            if summary_elem is not None:
+                summary_text = _get_text(summary_elem)
                 # 也可以尝试获取 title 属性（可能包含完整摘要）
-                summary_title = summary_elem.get('title', '')
+                summary_title = _get_attr(summary_elem, 'title')
                 if summary_title and len(summary_title) > len(summary_text):
                     other_info['summary'] = summary_title
                 else:
                     other_info['summary'] = summary_text
             
             # 提取作者
-            author_elems = soup_element.find_all('span', class_='paper-author-name')
+            author_elems = _select_all(soup_element, 'span.paper-author-name')
             authors = []
             for author_elem in author_elems:
-                author_text = author_elem.get_text(strip=True)
+                author_text = _get_text(author_elem)
                 if author_text and author_text != '...':
                     authors.append(author_text)
             other_info['authors'] = authors
             
             # 提取智源社区ID（从链接中提取）
-            link = self.extract_link(entry)
+            if link is None:
+                link = self.extract_link(entry)
             if link:
                 # 链接格式：/paper/e9847a14-bb0f-4a32-9411-351d0b502838
                 # 或：https://hub.baai.ac.cn/paper/e9847a14-bb0f-4a32-9411-351d0b502838
-                match = re.search(r'/paper/([a-f0-9\-]+)', link)
+                match = _PAPER_ID_RE.search(link)
                 if match:
                     other_info['zhiyuan_id'] = match.group(1)
                     other_info['id'] = match.group(1)  # 同时设置通用 id
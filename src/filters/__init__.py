@@ -1,18 +1,20 @@
 """过滤器模块"""
 
-from .base import BaseFilter
+from .base import BaseFilter, FilterItem
 from .text_filters import TitleFilter, SummaryFilter, AuthorFilter
-from .time_filter import TimeRangeFilter
+from .time_filter import TimeContext, TimeRangeFilter
 from .logical import LogicalFilter, NotFilter
 from .manager import FilterManager
 from .category_rules import CategoryRuleClassifier
 
 __all__ = [
     "BaseFilter",
+    "FilterItem",
     "TitleFilter",
     "SummaryFilter",
     "AuthorFilter",
     "TimeRangeFilter",
+    "TimeContext",
     "LogicalFilter",
     "NotFilter",
     "FilterManager",
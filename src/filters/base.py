@@ -1,10 +1,35 @@
 """过滤器基类"""
 
 from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Iterable, Iterator, Protocol
 
 from ..models.crawl_item import CrawlItem
 
 
+class FilterItem(Protocol):
+    """
+    过滤器 match() 读取的条目接口
+
+    CrawlItem 满足该接口；分类时也可以传入只带这些属性的轻量视图，不必构造 CrawlItem。
+    """
+
+    @property
+    def title(self) -> str: ...
+
+    @property
+    def summary(self) -> str | None: ...
+
+    @property
+    def authors(self) -> Any: ...
+
+    @property
+    def published_time(self) -> datetime | None: ...
+
+    @property
+    def lower_cache(self) -> dict[str, str]: ...
+
+
 class BaseFilter(ABC):
     """过滤器基类，支持可选反选（negate）和描述信息（description）"""
 
@@ -19,17 +44,31 @@ class BaseFilter(ABC):
 
     def apply(self, items: list[CrawlItem]) -> list[CrawlItem]:
         """对一组条目应用过滤器"""
-        result: list[CrawlItem] = []
+        # negate 和 match 先读入局部变量；bool(...) != negate 等价于按 negate 取反
+        negate = self.negate
+        match = self.match
+        return [item for item in items if bool(match(item)) != negate]
+
+    def stream(self, items: Iterable[CrawlItem]) -> Iterator[CrawlItem]:
+        """
+        惰性地对条目流应用过滤器，用于在过滤器链中串联多个过滤器。
+        需要看到全部条目的过滤器（如带统计输出的过滤器）应重写此方法并物化列表。
+        """
+        negate = self.negate
         for item in items:
-            matched = self.match(item)
-            if self.negate:
-                matched = not matched
-            if matched:
-                result.append(item)
-        return result
+            if bool(self.match(item)) != negate:
+                yield item
+
+    @property
+    def cost(self) -> int:
+        """
+        单次 match 的估计开销（相对值），AND 组合中按此从小到大排列子过滤器，
+        让开销小的过滤器先淘汰条目
+        """
+        return 1
 
     @abstractmethod
-    def match(self, item: CrawlItem) -> bool:
+    def match(self, item: FilterItem) -> bool:
         """判断单个条目是否匹配过滤条件"""
         raise NotImplementedError
 
@@ -1,10 +1,21 @@
 """基于过滤器的分类规则，用于替代关键词 category_mapping。"""
 
+from collections import namedtuple
 from dataclasses import dataclass
 from typing import Any
 
 from .base import BaseFilter
+from .logical import LogicalFilter
 from .manager import FilterManager
+from .text_filters import _KeywordTextFilter
+from ..utils.keyword_matcher import build_keyword_automaton
+
+
+# classify_items 中传给过滤器的轻量条目视图，提供过滤器读取的全部属性（满足 FilterItem 接口）
+# （title、summary、authors、published_time、lower_cache 等），不必为每个条目构造 CrawlItem 和 other_info 字典
+_FilterView = namedtuple(
+    "_FilterView", "title link published_time summary authors categories lower_cache"
+)
 
 
 @dataclass
@@ -14,14 +25,96 @@ class CategoryRule:
     filter: BaseFilter
 
 
+def _collect_keyword_leaves(flt: BaseFilter) -> list[_KeywordTextFilter] | None:
+    """
+    如果过滤器只由关键词文本过滤器经 OR 组合而成（不含 negate、空关键词列表），
+    返回其中全部的关键词过滤器；否则返回 None。
+    这类规则等价于“任一字段包含任一关键词”，可以并入按字段的多模式匹配。
+    """
+    if flt.negate:
+        return None
+    if isinstance(flt, _KeywordTextFilter):
+        return [flt] if flt.keywords else None
+    if isinstance(flt, LogicalFilter) and flt.operator == "or" and flt.filters:
+        leaves: list[_KeywordTextFilter] = []
+        for child in flt.filters:
+            child_leaves = _collect_keyword_leaves(child)
+            if child_leaves is None:
+                return None
+            leaves.extend(child_leaves)
+        return leaves
+    return None
+
+
+class _FieldKeywordIndex:
+    """某个字段（标题/摘要/作者）上所有规则的关键词，扫描一次文本即可得到命中的规则"""
+
+    def __init__(self, leaf: _KeywordTextFilter):
+        # 用该字段的任一关键词过滤器读取小写文本，与过滤器共享 CrawlItem.lower_cache
+        self.leaf = leaf
+        # 关键词 -> 包含该关键词的规则下标（相同关键词只匹配一次）
+        self.rules_by_keyword: dict[str, list[int]] = {}
+        self.keywords: list[str] = []
+        self.rule_ids: list[list[int]] = []
+        self.automaton = None
+
+    def add(self, keyword: str, rule_index: int) -> None:
+        rule_ids = self.rules_by_keyword.setdefault(keyword, [])
+        if rule_index not in rule_ids:
+            rule_ids.append(rule_index)
+
+    def build(self) -> None:
+        self.keywords = list(self.rules_by_keyword)
+        self.rule_ids = [self.rules_by_keyword[keyword] for keyword in self.keywords]
+        # 关键词较多且安装了加速库时使用多模式自动机，否则逐个关键词查找
+        self.automaton = build_keyword_automaton(self.keywords)
+
+    def match_rules(self, text: str, matched: set[int]) -> None:
+        """将文本中命中的规则下标加入 matched"""
+        if not text:
+            return
+        rule_ids = self.rule_ids
+        if self.automaton is not None:
+            for index in self.automaton.find(text):
+                matched.update(rule_ids[index])
+            return
+        for keyword, ids in zip(self.keywords, rule_ids):
+            # 该关键词涉及的规则都已命中时无需再查找
+            if not matched.issuperset(ids) and keyword in text:
+                matched.update(ids)
+
+
 class CategoryRuleClassifier:
     """
     使用过滤器规则进行分类，接口兼容 BaseOrgExporter 期望的 keyword_classifier：
     提供 classify_items(items) -> {category: [items]}。
     """
 
+    # 分类器缓存（category_mapping 配置的 JSON 表示 -> 分类器），配置未变化时复用，
+    # 不再每轮重新创建过滤器和关键词索引
+    _cache: dict[str, "CategoryRuleClassifier"] = {}
+    _CACHE_MAX_SIZE = 32
+
     def __init__(self, rules: list[CategoryRule]):
         self.rules = rules or []
+        # 纯关键词规则按字段合并索引；其余规则在 classify_items 中逐条调用 match
+        self._field_indexes: list[_FieldKeywordIndex] = []
+        self._generic_rules: list[int] = []
+        field_indexes: dict[str, _FieldKeywordIndex] = {}
+        for rule_index, rule in enumerate(self.rules):
+            leaves = _collect_keyword_leaves(rule.filter)
+            if leaves is None:
+                self._generic_rules.append(rule_index)
+                continue
+            for leaf in leaves:
+                field_index = field_indexes.get(leaf._cache_key)
+                if field_index is None:
+                    field_index = field_indexes[leaf._cache_key] = _FieldKeywordIndex(leaf)
+                for keyword in leaf.keywords:
+                    field_index.add(keyword, rule_index)
+        for field_index in field_indexes.values():
+            field_index.build()
+        self._field_indexes = list(field_indexes.values())
 
     @classmethod
     def from_config(cls, category_cfg: dict[str, Any]) -> "CategoryRuleClassifier":
@@ -41,6 +134,20 @@ class CategoryRuleClassifier:
 
         向后兼容旧格式（value 为关键字列表），会自动转为 title+summary OR 过滤器。
         """
+        key = FilterManager.config_key(category_cfg)
+        if key is not None:
+            classifier = cls._cache.get(key)
+            if classifier is None:
+                classifier = cls._build(category_cfg)
+                if len(cls._cache) >= cls._CACHE_MAX_SIZE:
+                    cls._cache.clear()
+                cls._cache[key] = classifier
+            return classifier
+        return cls._build(category_cfg)
+
+    @classmethod
+    def _build(cls, category_cfg: dict[str, Any]) -> "CategoryRuleClassifier":
+        """根据配置创建分类器（不使用缓存）"""
         rules: list[CategoryRule] = []
         if not category_cfg:
             return cls(rules)
@@ -77,31 +184,40 @@ class CategoryRuleClassifier:
         我们假设之前过滤链已经在 CrawlItem 层做过，这里只根据已有的信息判断。
         简化处理：按 title / summary / authors / published_time 字段构造一个轻量对象。
         """
-        from ..models.crawl_item import CrawlItem
-
         result: dict[str, list[dict]] = {}
+        setdefault = result.setdefault
+        rule_names = [rule.name for rule in self.rules]
+        # 循环中用到的方法先绑定到局部变量，省去每个条目的属性查找
+        field_scans = [(field_index.match_rules, field_index.leaf.lower_text) for field_index in self._field_indexes]
+        generic_matches = [(rule_index, self.rules[rule_index].filter.match) for rule_index in self._generic_rules]
 
         for item in items:
-            # 构造临时 CrawlItem 以复用过滤器逻辑
-            tmp = CrawlItem(
-                title=item.get("title", ""),
-                link=item.get("link", ""),
-                published_time=item.get("published_time"),
-                other_info={
-                    "summary": item.get("summary", ""),
-                    "authors": item.get("authors", []),
-                    "categories": item.get("categories", []),
-                },
+            # 构造轻量视图以复用过滤器逻辑
+            get = item.get
+            tmp = _FilterView(
+                get("title", ""),
+                get("link", ""),
+                get("published_time"),
+                get("summary", ""),
+                get("authors", []),
+                get("categories", []),
+                {},
             )
 
-            matched_categories: list[str] = []
-            for rule in self.rules:
-                if rule.filter.match(tmp):
-                    matched_categories.append(rule.name)
-                    result.setdefault(rule.name, []).append(item)
-
-            # 将分类写回 item['categories']
-            if matched_categories:
+            # 每个字段只扫描一次，得到所有命中的纯关键词规则
+            matched_rules: set[int] = set()
+            for match_rules, lower_text in field_scans:
+                match_rules(lower_text(tmp), matched_rules)
+            for rule_index, match in generic_matches:
+                if match(tmp):
+                    matched_rules.add(rule_index)
+
+            # 将分类写回 item['categories']（只有命中分类的条目需要合并）
+            if matched_rules:
+                # 按规则的配置顺序输出
+                matched_categories = [rule_names[rule_index] for rule_index in sorted(matched_rules)]
+                for name in matched_categories:
+                    setdefault(name, []).append(item)
                 existing = item.get("categories", [])
                 if not isinstance(existing, list):
                     existing = [existing] if existing else []
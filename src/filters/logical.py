@@ -1,8 +1,7 @@
 """逻辑组合过滤器：AND / OR / NOT"""
 
 
-from .base import BaseFilter
-from ..models.crawl_item import CrawlItem
+from .base import BaseFilter, FilterItem
 
 
 class LogicalFilter(BaseFilter):
@@ -22,15 +21,23 @@ class LogicalFilter(BaseFilter):
             raise ValueError(f"未知逻辑操作符: {operator}")
         self.operator = op
         self.filters = filters or []
+        if op == "and":
+            # AND 的结果与子过滤器顺序无关，先执行开销小的过滤器以便尽早短路
+            # （稳定排序，开销相同时保持配置顺序；OR 保持配置顺序不变）
+            self.filters = sorted(self.filters, key=lambda flt: flt.cost)
 
-    def match(self, item: CrawlItem) -> bool:
+    @property
+    def cost(self) -> int:
+        return sum(flt.cost for flt in self.filters)
+
+    def match(self, item: FilterItem) -> bool:
         if not self.filters:
             return True
-        results = [flt.match(item) for flt in self.filters]
+        # 使用生成器让 all/any 短路：结果一旦确定就不再调用后面的子过滤器
         if self.operator == "and":
-            return all(results)
+            return all(flt.match(item) for flt in self.filters)
         else:
-            return any(results)
+            return any(flt.match(item) for flt in self.filters)
 
 
 class NotFilter(BaseFilter):
@@ -41,7 +48,11 @@ class NotFilter(BaseFilter):
         super().__init__(negate=negate, description=description)
         self.flt = flt
 
-    def match(self, item: CrawlItem) -> bool:
+    @property
+    def cost(self) -> int:
+        return self.flt.cost
+
+    def match(self, item: FilterItem) -> bool:
         # 先取子过滤器结果，再取反
         return not self.flt.match(item)
 
@@ -1,5 +1,6 @@
 """过滤器管理器：根据配置创建过滤器链"""
 
+import json
 from typing import Any
 
 from .base import BaseFilter
@@ -19,6 +20,28 @@ class FilterManager:
         # "and" / "or" 由专门逻辑处理
     }
 
+    # 过滤器链缓存（配置的 JSON 表示 -> 过滤器列表）。持续运行模式每轮都会重新加载配置，
+    # 配置未变化时直接复用上一轮创建的过滤器（过滤器不保存状态，相对时间范围在匹配时计算）
+    _cache: dict[str, list[BaseFilter]] = {}
+    _CACHE_MAX_SIZE = 128
+
+    @staticmethod
+    def config_key(configs: Any) -> str | None:
+        """
+        生成配置的缓存键
+        
+        Args:
+            configs: 过滤器配置（列表或字典）
+            
+        Returns:
+            缓存键；配置无法序列化时返回 None（不缓存）
+        """
+        try:
+            # default=repr：YAML 解析出的日期等对象与同值的字符串得到不同的键
+            return json.dumps(configs, sort_keys=True, ensure_ascii=False, default=repr)
+        except (TypeError, ValueError):
+            return None
+
     @classmethod
     def _create_single_filter(cls, cfg: dict[str, Any]) -> BaseFilter | None:
         if not isinstance(cfg, dict):
@@ -33,7 +56,7 @@ class FilterManager:
         # 逻辑组合过滤器 AND / OR
         if f_type in ("and", "or"):
             sub_cfgs = cfg.get("filters", [])
-            sub_filters = cls.create_filters(sub_cfgs)
+            sub_filters = cls._create_filters(sub_cfgs)
             if not sub_filters:
                 return None
             description = cfg.get("description")
@@ -51,7 +74,7 @@ class FilterManager:
                     sub_cfg = sub_list[0]
             if not sub_cfg:
                 return None
-            sub_filters = cls.create_filters([sub_cfg])
+            sub_filters = cls._create_filters([sub_cfg])
             if not sub_filters:
                 return None
             description = cfg.get("description")
@@ -88,6 +111,38 @@ class FilterManager:
 
     @classmethod
     def create_filters(cls, configs: list[dict[str, Any]]) -> list[BaseFilter]:
+        """
+        根据配置创建过滤器链（按估计开销排序），相同的配置复用已创建的过滤器实例
+        
+        Args:
+            configs: 过滤器配置列表
+            
+        Returns:
+            过滤器列表（每次返回新的列表对象）
+        """
+        if not configs:
+            return []
+        key = cls.config_key(configs)
+        if key is None:
+            return cls._order_by_cost(cls._create_filters(configs))
+        filters = cls._cache.get(key)
+        if filters is None:
+            filters = cls._order_by_cost(cls._create_filters(configs))
+            if len(cls._cache) >= cls._CACHE_MAX_SIZE:
+                cls._cache.clear()
+            cls._cache[key] = filters
+        return list(filters)
+
+    @staticmethod
+    def _order_by_cost(filters: list[BaseFilter]) -> list[BaseFilter]:
+        """
+        过滤器链按顺序串联（相当于 AND），结果与顺序无关：
+        按估计开销稳定排序，让时间过滤器等开销小的过滤器先淘汰条目
+        """
+        return sorted(filters, key=lambda flt: flt.cost)
+
+    @classmethod
+    def _create_filters(cls, configs: list[dict[str, Any]]) -> list[BaseFilter]:
         filters: list[BaseFilter] = []
         if not configs:
             return filters
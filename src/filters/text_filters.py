@@ -1,52 +1,131 @@
 """基于文本内容的过滤器：标题、摘要、作者"""
 
+import re
+from typing import Callable
 
-from .base import BaseFilter
-from ..models.crawl_item import CrawlItem
+from .base import BaseFilter, FilterItem
+from ..utils.keyword_matcher import KeywordAutomaton, build_keyword_automaton
 
 
 class _KeywordTextFilter(BaseFilter):
     """通用关键字文本过滤器"""
 
+    # 小写文本在 CrawlItem.lower_cache 中的键，子类按字段区分
+    _cache_key = ""
+
     def __init__(self, keywords: list[str], negate: bool = False, description: str | None = None):
         super().__init__(negate=negate, description=description)
         self.keywords = [k.strip().lower() for k in keywords if k and k.strip()]
-
-    def _get_text(self, item: CrawlItem) -> str:
+        # 关键词较多且安装了加速库时，一次扫描文本即可判断是否包含任一关键词
+        self._automaton = build_keyword_automaton(self.keywords)
+        # 按关键词数量和是否有自动机选择匹配实现，match() 委托给它
+        self._matcher = self._select_matcher()
+
+    @property
+    def cost(self) -> int:
+        # 使用自动机时只扫描一次文本，否则每个关键词各做一次子串查找
+        if self._automaton is not None:
+            return 2
+        return max(1, len(self.keywords))
+
+    def _get_text(self, item: FilterItem) -> str:
         raise NotImplementedError
 
-    def match(self, item: CrawlItem) -> bool:
+    def lower_text(self, item: FilterItem) -> str:
+        """获取条目对应字段的小写文本（同一条目经过多个过滤器时，每个字段只做一次 lower()）"""
+        cache = item.lower_cache
+        text = cache.get(self._cache_key)
+        if text is None:
+            text = cache[self._cache_key] = self._get_text(item).lower()
+        return text
+
+    def _select_matcher(self) -> Callable[[FilterItem], bool]:
+        """
+        选择匹配实现：
+        - 没有关键词：不做限制
+        - 有自动机：一次扫描判断是否包含任一关键词
+        - 单个关键词：一次子串查找
+        - 多个关键词：合并正则一次扫描
+        """
         if not self.keywords:
-            return True
-        text = self._get_text(item).lower()
-        if not text:
-            return False
-        return any(kw in text for kw in self.keywords)
+            return self._match_all
+        if self._automaton is not None:
+            return self._make_automaton_match(self._automaton)
+        if len(self.keywords) == 1:
+            return self._make_single_match(self.keywords[0])
+        return self._make_pattern_match(self.keywords)
+
+    @staticmethod
+    def _match_all(item: FilterItem) -> bool:
+        """没有关键词时过滤器不做限制"""
+        return True
+
+    def _make_automaton_match(self, automaton: KeywordAutomaton) -> Callable[[FilterItem], bool]:
+        """关键词较多且有自动机时，一次扫描文本即可判断是否包含任一关键词"""
+        contains_any = automaton.contains_any
+        lower_text = self.lower_text
+
+        def match(item: FilterItem) -> bool:
+            text = lower_text(item)
+            return bool(text) and contains_any(text)
+
+        return match
+
+    def _make_single_match(self, keyword: str) -> Callable[[FilterItem], bool]:
+        """单个关键词时省去循环，直接做一次子串查找（空文本不包含非空关键词）"""
+        lower_text = self.lower_text
+
+        def match(item: FilterItem) -> bool:
+            return keyword in lower_text(item)
+
+        return match
+
+    def _make_pattern_match(self, keywords: list[str]) -> Callable[[FilterItem], bool]:
+        """多个关键词且没有自动机时，用合并正则在 C 层一次扫描文本，省去逐个关键词的生成器循环"""
+        search = re.compile('|'.join(re.escape(keyword) for keyword in keywords)).search
+        lower_text = self.lower_text
+
+        def match(item: FilterItem) -> bool:
+            return search(lower_text(item)) is not None
+
+        return match
+
+    def match(self, item: FilterItem) -> bool:
+        return self._matcher(item)
 
 
 class TitleFilter(_KeywordTextFilter):
     """按标题关键字过滤"""
 
-    def _get_text(self, item: CrawlItem) -> str:
+    _cache_key = "title"
+
+    def _get_text(self, item: FilterItem) -> str:
         return item.title or ""
 
 
 class SummaryFilter(_KeywordTextFilter):
     """按摘要/简介关键字过滤"""
 
-    def _get_text(self, item: CrawlItem) -> str:
+    _cache_key = "summary"
+
+    def _get_text(self, item: FilterItem) -> str:
         return item.summary or ""
 
 
 class AuthorFilter(_KeywordTextFilter):
     """按作者关键字过滤"""
 
-    def _get_text(self, item: CrawlItem) -> str:
-        authors = item.other_info.get("authors", [])
+    _cache_key = "authors"
+
+    def _get_text(self, item: FilterItem) -> str:
+        authors = item.authors
+        # 作者通常是列表，先判断 list；用 map(str, ...) 代替生成器表达式
+        if type(authors) is list:
+            return ", ".join(map(str, authors))
         if isinstance(authors, str):
             return authors
         if isinstance(authors, list):
-            return ", ".join(str(a) for a in authors)
+            return ", ".join(map(str, authors))
         return str(authors)
 
 
@@ -1,11 +1,86 @@
 """按时间范围过滤"""
 
-from datetime import datetime, timedelta
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Callable, Iterable, Iterator
 
-from .base import BaseFilter
+from .base import BaseFilter, FilterItem
 from ..models.crawl_item import CrawlItem
 
 
+# 当天零点的时间部分，与 date 组合即得到当天 00:00:00（模块级常量，避免每次重新创建）。
+# 不用 dt.replace(hour=0, minute=0, second=0, microsecond=0)：带关键字参数的 replace()
+# 比 datetime.combine(dt.date(), _MIDNIGHT) 慢约 4 倍（约 1.3 µs 对 0.3 µs），
+# 而 date_only 模式下每个条目的发布时间都要标准化一次
+_MIDNIGHT = time()
+
+
+def _format_datetime(dt: datetime) -> str:
+    """格式化为 "YYYY-MM-DD HH:MM:SS"（isoformat 走 C 实现的直接路径，比 strftime 快）"""
+    return dt.isoformat(sep=' ', timespec='seconds')
+
+
+class TimeContext:
+    """
+    一次爬取中共用的"当前时间"
+    
+    同一轮过滤中的各个时间过滤器（以及日志输出、提前淘汰判断）使用同一个 now，
+    既省去重复的 datetime.now() 调用，也保证它们看到一致的时间。
+    """
+
+    __slots__ = ('now', 'today_start', 'ranges')
+
+    def __init__(self, now: datetime | None = None):
+        """
+        Args:
+            now: 当前时间，为 None 时使用 datetime.now()
+        """
+        self.now = now if now is not None else datetime.now()
+        self.today_start = datetime.combine(self.now.date(), _MIDNIGHT)
+        # 各时间过滤器按本上下文计算好的时间范围（过滤器 -> (start, end)），一轮过滤中只计算一次
+        self.ranges: dict[TimeRangeFilter, tuple[datetime | None, datetime | None]] = {}
+
+
+# 当前一轮过滤使用的时间上下文。过滤器实例由 FilterManager 缓存并在多个爬虫间共享，
+# 因此不能把时间上下文保存在过滤器上；ContextVar 在每个线程 / 协程中相互独立
+_current_context: ContextVar[TimeContext | None] = ContextVar('time_filter_context', default=None)
+
+
+@contextmanager
+def use_time_context(ctx: TimeContext) -> Iterator[TimeContext]:
+    """
+    在 with 块内让时间过滤器的 match() 使用同一个时间上下文
+    
+    嵌套在 AND/OR/NOT 中的时间过滤器只能通过 match() 判断，拿不到 apply() 的 ctx 参数，
+    由此与链上其他时间过滤器看到同一个当前时间。
+    
+    Args:
+        ctx: 时间上下文
+    """
+    token = _current_context.set(ctx)
+    try:
+        yield ctx
+    finally:
+        _current_context.reset(token)
+
+
+def iter_time_filters(filters: Iterable[BaseFilter]) -> Iterator["TimeRangeFilter"]:
+    """遍历过滤器树（包括 AND/OR 的 filters 和 NOT 的 flt），依次产出其中的时间过滤器"""
+    stack = list(filters)
+    while stack:
+        flt = stack.pop()
+        if isinstance(flt, TimeRangeFilter):
+            yield flt
+        children = getattr(flt, 'filters', None)
+        if children:
+            stack.extend(children)
+        child = getattr(flt, 'flt', None)
+        if child is not None:
+            stack.append(child)
+
+
 class TimeRangeFilter(BaseFilter):
     """
     按时间范围过滤：
@@ -43,9 +118,37 @@ class TimeRangeFilter(BaseFilter):
         self.relative_hours_end = relative_hours_end
         self.yesterday = yesterday
         self.date_only = date_only
+        # 绝对时间在构造时解析一次（含 date_only 标准化），_get_range 直接使用
+        self._start_dt = self._parse_absolute(start)
+        self._end_dt = self._parse_absolute(end)
+
+    def _parse_absolute(self, value: str | None) -> datetime | None:
+        """解析绝对时间配置，date_only 时标准化为当天的 00:00:00"""
+        if not value:
+            return None
+        dt = self._parse_datetime(value)
+        if self.date_only and dt:
+            dt = self._normalize_to_date(dt)
+        return dt
 
     def _parse_datetime(self, value: str) -> datetime | None:
         """尽量解析多种常见的时间格式"""
+        # YAML 中未加引号的日期会被解析为 date / datetime 对象
+        if isinstance(value, datetime):
+            return value
+        if isinstance(value, date):
+            return datetime.combine(value, _MIDNIGHT)
+        # 配置中的时间约定为 ISO 风格（"2024-01-01" 或 "2024-01-01 08:00:00"），
+        # 优先使用 C 实现的 fromisoformat，失败时再回退到 strptime 逐个尝试
+        try:
+            dt = datetime.fromisoformat(value)
+        except ValueError:
+            dt = None
+        if dt is not None:
+            # 带时区的时间转换为 UTC 的 naive datetime，与条目的发布时间保持一致
+            if dt.tzinfo is not None:
+                dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+            return dt
         for fmt in ("%Y-%m-%d", "%Y-%m-%d %H:%M:%S"):
             try:
                 return datetime.strptime(value, fmt)
@@ -55,11 +158,13 @@ class TimeRangeFilter(BaseFilter):
 
     def _normalize_to_date(self, dt: datetime) -> datetime:
         """将时间标准化为当天的 00:00:00（用于日期比较）"""
-        return datetime.combine(dt.date(), datetime.min.time())
+        return datetime.combine(dt.date(), _MIDNIGHT)
 
-    def _get_range(self) -> tuple[datetime | None, datetime | None]:
-        now = datetime.now()
-        today_start = self._normalize_to_date(now)
+    def _get_range(self, ctx: TimeContext | None = None) -> tuple[datetime | None, datetime | None]:
+        if ctx is None:
+            ctx = TimeContext()
+        now = ctx.now
+        today_start = ctx.today_start
 
         start_dt = None
         end_dt = None
@@ -97,52 +202,87 @@ class TimeRangeFilter(BaseFilter):
                 end_dt = now
             return start_dt, end_dt
 
-        # 绝对时间优先
-        if self.start_str:
-            start_dt = self._parse_datetime(self.start_str)
-            if self.date_only and start_dt:
-                start_dt = self._normalize_to_date(start_dt)
-        if self.end_str:
-            end_dt = self._parse_datetime(self.end_str)
-            if self.date_only and end_dt:
-                end_dt = self._normalize_to_date(end_dt)
+        # 绝对时间（已在构造时解析）
+        return self._start_dt, self._end_dt
 
-        return start_dt, end_dt
-
-    def get_range_str(self) -> str:
+    def get_range_str(self, ctx: TimeContext | None = None) -> str:
         """
         获取时间范围的字符串表示，用于日志输出
         
+        Args:
+            ctx: 共用的时间上下文（可选），为 None 时使用当前时间
+        
         Returns:
             时间范围的字符串描述（说明区间为左闭右开）
         """
-        start_dt, end_dt = self._get_range()
+        start_dt, end_dt = self._get_range(ctx)
         
         if start_dt and end_dt:
-            start_str = start_dt.strftime('%Y-%m-%d %H:%M:%S')
-            end_str = end_dt.strftime('%Y-%m-%d %H:%M:%S')
+            start_str = _format_datetime(start_dt)
+            end_str = _format_datetime(end_dt)
             mode_str = "（仅日期）" if self.date_only else ""
             return f"[{start_str}, {end_str}){mode_str}（左闭右开）"
         elif start_dt:
-            start_str = start_dt.strftime('%Y-%m-%d %H:%M:%S')
+            start_str = _format_datetime(start_dt)
             mode_str = "（仅日期）" if self.date_only else ""
             return f"[{start_str}, +∞){mode_str}（左闭）"
         elif end_dt:
-            end_str = end_dt.strftime('%Y-%m-%d %H:%M:%S')
+            end_str = _format_datetime(end_dt)
             mode_str = "（仅日期）" if self.date_only else ""
             return f"(-∞, {end_str}){mode_str}（右开）"
         else:
             return "无时间限制"
 
-    def match(self, item: CrawlItem) -> bool:
+    def make_reject_check(self, ctx: TimeContext | None = None) -> Callable[[datetime], bool] | None:
+        """
+        生成"提前淘汰"判断函数，供爬虫在提取条目其余字段之前跳过时间范围外的条目
+        
+        时间范围只计算一次，判断逻辑与 match() 一致（左闭右开，支持 date_only）。
+        
+        Args:
+            ctx: 共用的时间上下文（可选），为 None 时使用当前时间
+        
+        Returns:
+            判断函数（返回 True 表示该发布时间一定会被本过滤器淘汰）；
+            反选过滤器或没有时间限制时无法提前判断，返回 None
+        """
+        if self.negate:
+            return None
+        start_dt, end_dt = self._get_range(ctx)
+        if start_dt is None and end_dt is None:
+            return None
+        date_only = self.date_only
+        normalize = self._normalize_to_date
+
+        def reject(pub: datetime) -> bool:
+            if date_only:
+                pub = normalize(pub)
+            return (start_dt is not None and pub < start_dt) or (end_dt is not None and pub >= end_dt)
+
+        return reject
+
+    def match(self, item: FilterItem) -> bool:
         """
         判断条目是否匹配时间范围
         
         时间区间为左闭右开 [start, end)：
         - start_dt <= pub < end_dt
         - 即：pub >= start_dt 且 pub < end_dt
+        
+        在 use_time_context() 内调用时使用其时间上下文，否则按当前时间计算。
         """
-        start_dt, end_dt = self._get_range()
+        ctx = _current_context.get()
+        if ctx is None:
+            start_dt, end_dt = self._get_range()
+        else:
+            bounds = ctx.ranges.get(self)
+            if bounds is None:
+                bounds = ctx.ranges[self] = self._get_range(ctx)
+            start_dt, end_dt = bounds
+        return self._match_with_range(item, start_dt, end_dt)
+
+    def _match_with_range(self, item: FilterItem, start_dt: datetime | None, end_dt: datetime | None) -> bool:
+        """按已计算好的时间范围判断条目是否匹配（批量过滤时时间范围只计算一次）"""
         pub = item.published_time
         if not isinstance(pub, datetime):
             return False
@@ -159,32 +299,50 @@ class TimeRangeFilter(BaseFilter):
             return False
         return True
     
-    def apply(self, items: list[CrawlItem]) -> list[CrawlItem]:
-        """对一组条目应用过滤器，并输出调试信息"""
+    def stream(self, items: Iterable[CrawlItem], ctx: TimeContext | None = None) -> Iterator[CrawlItem]:
+        """在过滤器链中使用 apply()，以保留不匹配条目的调试输出"""
+        return iter(self.apply(list(items), ctx))
+
+    def apply(self, items: list[CrawlItem], ctx: TimeContext | None = None) -> list[CrawlItem]:
+        """
+        对一组条目应用过滤器，并输出调试信息
+        
+        Args:
+            items: 条目列表
+            ctx: 共用的时间上下文（可选），为 None 时使用当前时间
+        """
         from ..utils.logger import get_logger
         logger = get_logger()
         
-        start_dt, end_dt = self._get_range()
+        # 时间范围在整批条目中只计算一次
+        start_dt, end_dt = self._get_range(ctx)
         result: list[CrawlItem] = []
         sample_count = 0
-        max_samples = 3  # 只输出前3个不匹配的条目作为示例
+        # 只输出前3个不匹配的条目作为示例；INFO 日志关闭时不输出，也就不必拼接原因
+        max_samples = 3 if logger.isEnabledFor(logging.INFO) else 0
+        # 范围边界的字符串在整批条目中只格式化一次
+        start_str = _format_datetime(start_dt) if start_dt else ""
+        end_str = _format_datetime(end_dt) if end_dt else ""
+        
+        # 循环中用到的属性先读入局部变量
+        match_with_range = self._match_with_range
+        negate = self.negate
+        append = result.append
         
         for item in items:
-            matched = self.match(item)
-            if self.negate:
-                matched = not matched
+            if match_with_range(item, start_dt, end_dt) != negate:
+                append(item)
+                continue
             
             # 输出前几个不匹配条目的调试信息
-            if not matched and sample_count < max_samples:
+            if sample_count < max_samples:
                 pub = item.published_time
                 if isinstance(pub, datetime):
-                    pub_str = pub.strftime('%Y-%m-%d %H:%M:%S')
+                    pub_str = _format_datetime(pub)
                     if start_dt:
-                        start_str = start_dt.strftime('%Y-%m-%d %H:%M:%S')
                         if pub < start_dt:
                             reason = f"发布时间 {pub_str} < 开始时间 {start_str}"
                         elif end_dt and pub >= end_dt:
-                            end_str = end_dt.strftime('%Y-%m-%d %H:%M:%S')
                             reason = f"发布时间 {pub_str} >= 结束时间 {end_str}"
                         else:
                             reason = "未知原因"
@@ -192,10 +350,5 @@ class TimeRangeFilter(BaseFilter):
                         reason = "无开始时间限制"
                     logger.info(f"[时间过滤器] 条目不匹配: {item.title[:50]}... | {reason}")
                     sample_count += 1
-            
-            if matched:
-                result.append(item)
         
         return result
-
-
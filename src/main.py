@@ -1,12 +1,24 @@
 """主程序入口"""
 
-import time
+import asyncio
+import logging
+import os
+import threading
 import signal
+import time
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timedelta
 
 from typing import Any
 import argparse
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .utils.logger import setup_logger, get_logger
 from .utils.config_loader import load_global_config, load_rule_config
 from .crawler.crawler_manager import CrawlerManager
@@ -17,26 +29,137 @@ from .storage.index_manager import IndexManager
 from .filters import FilterManager, CategoryRuleClassifier
 from .tools import Translator
 
-parser = argparse.ArgumentParser(description='Org Crawler')
-parser.add_argument('-c', '--continuous', action='store_true', help='持续运行模式')
-parser.add_argument('-r', '--repair', action='store_true', help='修复模式')
-args = parser.parse_args()
 
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    解析命令行参数（只在作为脚本运行时调用，导入本模块不会解析参数）
+    
+    Args:
+        argv: 参数列表，为 None 时使用 sys.argv
+        
+    Returns:
+        解析后的参数
+    """
+    parser = argparse.ArgumentParser(description='Org Crawler')
+    parser.add_argument('-c', '--continuous', action='store_true', help='持续运行模式')
+    parser.add_argument('-r', '--repair', action='store_true', help='修复模式')
+    return parser.parse_args(argv)
+
+
+def _write_json_result(path: Path, header: dict[str, Any], items: list[dict]) -> None:
+    """
+    流式写出 JSON 结果文件：{**header, "items": items}
+    
+    条目逐个序列化后写入缓冲区，峰值内存只有单个条目的序列化结果；
+    输出与整体调用 _dump_json 完全相同（两空格缩进，items 位于最后）。
+    
+    Args:
+        path: 输出文件路径
+        header: items 之前的字段
+        items: 条目列表
+    """
+    # _dump_json(header) 形如 b'{\n  "k": v\n}'，去掉结尾的 "\n}" 后接上 items
+    head = _dump_json(header)[:-2] if header else b'{'
+    with open(path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(head)
+        f.write(b',\n  "items": [' if header else b'\n  "items": [')
+        if not items:
+            f.write(b']\n}')
+            return
+        separator = b'\n    '
+        for index, item in enumerate(items):
+            if index:
+                f.write(b',')
+            # 条目位于第 2 层，每行再缩进 4 个空格
+            f.write(separator)
+            f.write(_dump_json(item).replace(b'\n', separator))
+        f.write(b'\n  ]\n}')
+
+
+def _dump_json(data: Any) -> bytes:
+    """
+    将数据序列化为带两空格缩进的 UTF-8 JSON
+    
+    安装了 orjson 时优先使用（C 扩展，速度快数倍）；未安装或遇到 orjson
+    不支持的数据（例如超出 64 位的整数）时回退到标准库 json。
+    
+    Args:
+        data: 待序列化的数据
+        
+    Returns:
+        UTF-8 编码的 JSON 字节串
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+# 写出 JSON 结果文件时使用的缓冲区大小
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# setup_runtime 的结果缓存：规则文件路径 -> ((mtime_ns, 文件大小), 全局配置, 组件元组)
+_RUNTIME_CACHE: dict[str, tuple[tuple[int, int], dict, tuple]] = {}
 
-# 全局变量用于信号处理
-running = True
+# 日志中的分隔线
+_BANNER = "=" * 60
+_SEPARATOR = "-" * 60
+
+# 停止信号：信号处理函数设置后，调度等待立即结束，主循环退出
+stop_event = threading.Event()
 
 
 def signal_handler(signum, frame):
     """信号处理函数，用于优雅退出"""
-    global running
     logger = get_logger()
     logger.info("收到退出信号，正在停止...")
-    running = False
+    stop_event.set()
+
+
+@lru_cache(maxsize=None)
+def _parse_crawl_time(crawl_time_str: str) -> tuple[int, int]:
+    """
+    解析定时爬取时间（格式：HH:MM，例如 "08:00"），同一字符串只解析一次
+    
+    Returns:
+        (hour, minute)
+    
+    Raises:
+        ValueError: 时间格式错误
+    """
+    hour, minute = map(int, crawl_time_str.split(':'))
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        raise ValueError("时间格式错误")
+    return hour, minute
+
+
+def _next_crawl_time(hour: int, minute: int) -> datetime:
+    """计算下一次到达 hour:minute 的墙上时间（今天已过则为明天）"""
+    now = datetime.now()
+    next_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if next_time <= now:
+        next_time += timedelta(days=1)
+    return next_time
+
+
+def _log_banner(logger, title: str):
+    """输出带分隔线的标题日志（INFO 日志关闭时直接跳过）"""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(_BANNER)
+        logger.info(title)
+        logger.info(_BANNER)
+
+
+def _log_crawl_start(logger):
+    """输出开始爬取的日志"""
+    if logger.isEnabledFor(logging.INFO):
+        _log_banner(logger, f"开始执行爬取 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
 
 def run_crawl(crawler, path_manager, org_exporter, index_manager,
-              file_manager, storage_config, logger):
+              file_manager, storage_config, logger, result=None):
     """
     执行一次爬取任务
     
@@ -48,16 +171,15 @@ def run_crawl(crawler, path_manager, org_exporter, index_manager,
         file_manager: 文件管理器
         storage_config: 存储配置
         logger: 日志记录器
+        result: 已完成的爬取结果（可选），提供时不再调用 crawler.crawl()，只保存结果
         
     Returns:
         bool: 是否成功
     """
     try:
-        logger.info("=" * 60)
-        logger.info(f"开始执行爬取 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        logger.info("=" * 60)
-        
-        result = crawler.crawl()
+        if result is None:
+            _log_crawl_start(logger)
+            result = crawler.crawl()
         
         if result.success:
             logger.info(f"爬取成功，获取到 {result.items_count} 个条目")
@@ -102,13 +224,16 @@ def run_crawl(crawler, path_manager, org_exporter, index_manager,
                 
                 # 保存 Org-mode
                 if 'org' in output_formats:
-                    org_exporter.export(result, org_path)
+                    org_exporter.export(result, org_path, categorized_items=categorized_items)
                     
                     # 如果启用了分类，显示每个类别的文件路径
                     if categorized_items:
+                        # 路径只用于日志，直接拼接字符串，无需构造 Path 对象
+                        org_parent, org_name = str(org_path.parent), org_path.name
+                        cf_get = org_exporter.category_folders.get
                         for category, items in categorized_items.items():
-                            category_folder = org_exporter.category_folders.get(category, category)
-                            category_path = org_path.parent / category_folder / org_path.name
+                            category_folder = cf_get(category, category)
+                            category_path = f"{org_parent}{os.sep}{category_folder}{os.sep}{org_name}"
                             logger.info(f"已保存 {category} 类别 Org-mode 文件: {category_path} ({len(items)} 个条目)")
                     else:
                         logger.info(f"已保存 Org-mode 文件: {org_path}")
@@ -117,33 +242,33 @@ def run_crawl(crawler, path_manager, org_exporter, index_manager,
                 if 'markdown' in output_formats:
                     # 使用相同的路径，但扩展名为 .md
                     md_path = org_path.with_suffix('.md')
-                    org_exporter.export_markdown(result, md_path)
+                    org_exporter.export_markdown(result, md_path, categorized_items=categorized_items)
                     
                     # 如果启用了分类，显示每个类别的文件路径
                     if categorized_items:
+                        md_parent, md_name = str(md_path.parent), md_path.name
+                        cf_get = org_exporter.category_folders.get
                         for category, items in categorized_items.items():
-                            category_folder = org_exporter.category_folders.get(category, category)
-                            category_path = md_path.parent / category_folder / md_path.name
+                            category_folder = cf_get(category, category)
+                            category_path = f"{md_parent}{os.sep}{category_folder}{os.sep}{md_name}"
                             logger.info(f"已保存 {category} 类别 Markdown 文件: {category_path} ({len(items)} 个条目)")
                     else:
                         logger.info(f"已保存 Markdown 文件: {md_path}")
                 
-                # 保存 JSON
+                # 保存 JSON（json_path 同时用于下面的元数据更新，未输出 JSON 时为 None）
+                json_path = None
                 if 'json' in output_formats:
                     # 使用与 org 文件相同的路径，但扩展名为 .json
                     json_path = org_path.with_suffix('.json')
                     json_path.parent.mkdir(parents=True, exist_ok=True)
                     
-                    # 保存 JSON 数据
-                    import json
-                    data = {
+                    # 保存 JSON 数据（逐个条目序列化写入，不在内存中生成整个文件）
+                    header = {
                         'site_name': result.site_name,
                         'crawl_time': result.crawl_time.isoformat(),
                         'items_count': result.items_count,
-                        'items': result.items
                     }
-                    with open(json_path, 'w', encoding='utf-8') as f:
-                        json.dump(data, f, ensure_ascii=False, indent=2)
+                    _write_json_result(json_path, header, result.items)
                     logger.info(f"已保存 JSON 文件: {json_path}")
                 
                 # 更新索引文件
@@ -158,40 +283,44 @@ def run_crawl(crawler, path_manager, org_exporter, index_manager,
                     )
                     logger.info(f"已更新索引文件: {index_manager.index_path}")
                 
-                # 更新元数据
-                json_path_for_metadata = None
-                if 'json' in output_formats:
-                    json_path_for_metadata = org_path.with_suffix('.json')
-                file_manager.update_metadata(result, json_path=json_path_for_metadata)
+                # 更新元数据（刚写入的 JSON 中的条目数就是本次结果的条目数，不必再读回文件）
+                file_manager.update_metadata(
+                    result,
+                    json_path=json_path,
+                    items_count=result.items_count if json_path is not None else None
+                )
                 logger.info("已更新元数据")
                 
                 # 如果启用了分类，显示每个类别的论文数量汇总
-                if categorized_items:
-                    logger.info("=" * 60)
+                if categorized_items and logger.isEnabledFor(logging.INFO):
+                    logger.info(_BANNER)
                     logger.info("各分类论文数量统计:")
-                    logger.info("-" * 60)
+                    logger.info(_SEPARATOR)
                     # 按类别名称排序输出
                     for category in sorted(categorized_items.keys()):
                         count = len(categorized_items[category])
                         logger.info(f"  {category}: {count} 篇")
-                    logger.info("-" * 60)
+                    logger.info(_SEPARATOR)
                     total_categorized = sum(len(items) for items in categorized_items.values())
                     logger.info(f"  总计: {total_categorized} 篇（可能有重复分类）")
-                    logger.info("=" * 60)
+                    logger.info(_BANNER)
                 
-                # 显示前几个条目
-                logger.info("前几个条目:")
-                for i, item in enumerate(result.items[:3], 1):
-                    logger.info(f"  {i}. {item.get('title', '无标题')[:60]}...")
+                # 显示前几个条目（合并为一条日志记录）
+                if logger.isEnabledFor(logging.INFO):
+                    preview = "\n".join(
+                        f"  {i}. {item.get('title', '无标题')[:60]}..."
+                        for i, item in enumerate(result.items[:3], 1)
+                    )
+                    logger.info("前几个条目:\n%s", preview)
             else:
                 logger.info("本次爬取没有新条目")
         else:
             logger.error(f"爬取失败: {result.error_message}")
             return False
         
-        logger.info("=" * 60)
-        logger.info("本次爬取完成")
-        logger.info("=" * 60)
+        # 结果全部写入后才保存爬取状态（如 ETag），导出失败时下次仍会完整下载
+        crawler.commit_crawl_state()
+        _log_banner(logger, "本次爬取完成")
         return True
         
     except Exception as e:
@@ -202,14 +331,24 @@ def run_crawl(crawler, path_manager, org_exporter, index_manager,
 def setup_runtime(global_config, logger, rule_file: str):
     """
     加载指定规则文件并初始化与站点相关的组件。
-    每次调用都会重新读取该规则文件，以便运行中修改配置可以生效。
+    每次调用都会检查该规则文件，运行中修改配置后会重新初始化，以便新配置生效；
+    文件未修改且全局配置相同时，直接复用上次初始化的组件。
     """
     # 加载规则配置
-    if not Path(rule_file).exists():
+    rule_path = Path(rule_file)
+    if not rule_path.exists():
         logger.error(f"规则文件不存在: {rule_file}")
         logger.info("请先创建规则配置文件")
         raise FileNotFoundError(f"规则文件不存在: {rule_file}")
 
+    stat = rule_path.stat()
+    cache_key = str(rule_path.resolve())
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _RUNTIME_CACHE.get(cache_key)
+    if cached is not None and cached[0] == signature and cached[1] is global_config:
+        logger.debug(f"规则文件未修改，复用已初始化的组件: {rule_file}")
+        return cached[2]
+
     # 加载规则（传入全局配置以获取默认更新频率）
     site_config = load_rule_config(rule_file, global_config)
     logger.info(f"加载规则: {site_config.name}")
@@ -350,12 +489,12 @@ def setup_runtime(global_config, logger, rule_file: str):
 
     filters = FilterManager.create_filters(filter_configs)
     if filters:
-        crawler.set_filters(filters)
+        crawler.set_filters(filters, config_key=FilterManager.config_key(filter_configs))
         logger.info(f"已配置 {len(filters)} 个过滤器")
     else:
         logger.info("未配置过滤器，将使用默认关键词过滤（如有）")
 
-    return (
+    runtime = (
         site_config,
         custom_config,
         storage_config,
@@ -364,17 +503,20 @@ def setup_runtime(global_config, logger, rule_file: str):
         index_manager,
         crawler,
     )
+    _RUNTIME_CACHE[cache_key] = (signature, global_config, runtime)
+    return runtime
 
 
-def run_once(rule_files: list[str] | None = None):
+def _bootstrap(mode_name: str):
     """
-    只运行一次的函数：执行所有规则文件后退出，不进入循环
+    单次运行和持续运行模式共用的启动流程：加载全局配置、设置日志、初始化文件管理器
     
     Args:
-        rule_files: 规则文件列表，如果为None则使用空列表
+        mode_name: 运行模式名称，用于启动日志
+        
+    Returns:
+        (global_config, logger, file_manager)
     """
-    if rule_files is None:
-        rule_files = []
     # 加载全局配置
     global_config = load_global_config()
     
@@ -386,9 +528,7 @@ def run_once(rule_files: list[str] | None = None):
         max_size_mb=log_config.get('max_size_mb', 10)
     )
     
-    logger.info("=" * 60)
-    logger.info("Org Crawler 启动（单次运行模式）")
-    logger.info("=" * 60)
+    _log_banner(logger, f"Org Crawler 启动（{mode_name}）")
     
     # 初始化组件（与全局配置相关的，只需初始化一次）
     storage_config = global_config.get('storage', {})
@@ -396,19 +536,39 @@ def run_once(rule_files: list[str] | None = None):
         base_path=storage_config.get('base_path', 'data'),
         date_format=storage_config.get('date_format', '%Y-%m-%d')
     )
+    return global_config, logger, file_manager
 
-    # 检查规则文件列表
-    if not rule_files:
-        logger.error("rule_files 为空，没有可运行的规则文件")
-        return
 
-    # 依次执行每个规则文件
-    for rule_file in rule_files:
+def _run_rule_files(global_config, logger, file_manager,
+                    rule_files: list[str]) -> list[tuple[str, BaseException | None]]:
+    """
+    执行多个规则文件的爬取：依次加载规则，由 CrawlerManager.crawl_all_async 并发抓取各站点，
+    全部完成后按规则文件顺序保存结果
+    
+    Args:
+        global_config: 全局配置
+        logger: 日志记录器
+        file_manager: 文件管理器（各站点共享）
+        rule_files: 规则文件列表
+        
+    Returns:
+        [(规则文件, 异常或 None)] 列表，顺序与 rule_files 相同，加载规则时的异常由调用方处理
+        （如规则文件不存在时的 FileNotFoundError）
+    """
+    errors: list[BaseException | None] = [None] * len(rule_files)
+    runtimes = []
+    for index, rule_file in enumerate(rule_files):
+        _log_banner(logger, f"开始处理规则文件: {rule_file}")
         try:
-            logger.info("=" * 60)
-            logger.info(f"开始处理规则文件: {rule_file}")
-            logger.info("=" * 60)
+            runtimes.append(setup_runtime(global_config, logger, rule_file))
+        except Exception as e:
+            errors[index] = e
 
+    if runtimes:
+        _log_crawl_start(logger)
+        crawlers = [runtime[6] for runtime in runtimes]
+        results = asyncio.run(CrawlerManager.crawl_all_async(crawlers, return_exceptions=True))
+        for runtime, result in zip(runtimes, results):
             (
                 _site_config,
                 _custom_config,
@@ -417,9 +577,11 @@ def run_once(rule_files: list[str] | None = None):
                 org_exporter,
                 index_manager,
                 crawler,
-            ) = setup_runtime(global_config, logger, rule_file)
-
-            # 执行爬取
+            ) = runtime
+            if isinstance(result, BaseException):
+                logger.error(f"爬取过程中发生错误: {result}", exc_info=result)
+                continue
+            # 对于每个站点，使用其自己的存储配置（目前来自全局 storage，但为将来扩展保留）
             run_crawl(
                 crawler=crawler,
                 path_manager=path_manager,
@@ -428,18 +590,37 @@ def run_once(rule_files: list[str] | None = None):
                 file_manager=file_manager,
                 storage_config=storage_config_site,
                 logger=logger,
+                result=result,
             )
-        except FileNotFoundError:
+
+    return list(zip(rule_files, errors))
+
+
+def run_once(rule_files: list[str] | None = None):
+    """
+    只运行一次的函数：执行所有规则文件后退出，不进入循环
+    
+    Args:
+        rule_files: 规则文件列表，如果为None则使用空列表
+    """
+    if rule_files is None:
+        rule_files = []
+    global_config, logger, file_manager = _bootstrap("单次运行模式")
+
+    # 检查规则文件列表
+    if not rule_files:
+        logger.error("rule_files 为空，没有可运行的规则文件")
+        return
+
+    # 并发抓取所有规则文件的站点，按规则文件顺序处理结果
+    for rule_file, error in _run_rule_files(global_config, logger, file_manager, rule_files):
+        if isinstance(error, FileNotFoundError):
             # 某个规则文件不存在时，记录错误但继续处理其他规则
             logger.error(f"规则文件不存在，跳过: {rule_file}")
-            continue
-        except Exception as e:
-            logger.error(f"处理规则文件 {rule_file} 时发生错误: {e}", exc_info=True)
-            continue
+        elif error is not None:
+            logger.error(f"处理规则文件 {rule_file} 时发生错误: {error}", exc_info=error)
 
-    logger.info("=" * 60)
-    logger.info("单次运行完成")
-    logger.info("=" * 60)
+    _log_banner(logger, "单次运行完成")
 
 
 def run_continuous(rule_files: list[str] | None = None):
@@ -451,27 +632,7 @@ def run_continuous(rule_files: list[str] | None = None):
     """
     if rule_files is None:
         rule_files = []
-    # 加载全局配置
-    global_config = load_global_config()
-
-    # 设置日志
-    log_config = global_config.get('logging', {})
-    logger = setup_logger(
-        level=log_config.get('level', 'INFO'),
-        log_file=log_config.get('file'),
-        max_size_mb=log_config.get('max_size_mb', 10)
-    )
-
-    logger.info("=" * 60)
-    logger.info("Org Crawler 启动（持续运行模式）")
-    logger.info("=" * 60)
-
-    # 初始化组件（与全局配置相关的，只需初始化一次）
-    storage_config = global_config.get('storage', {})
-    file_manager = FileManager(
-        base_path=storage_config.get('base_path', 'data'),
-        date_format=storage_config.get('date_format', '%Y-%m-%d')
-    )
+    global_config, logger, file_manager = _bootstrap("持续运行模式")
 
     # 注册信号处理器（用于优雅退出）
     signal.signal(signal.SIGINT, signal_handler)   # Ctrl+C
@@ -481,7 +642,7 @@ def run_continuous(rule_files: list[str] | None = None):
     logger.info("按 Ctrl+C 停止程序")
 
     # 持续运行循环
-    while running:
+    while not stop_event.is_set():
         try:
             if not rule_files:
                 logger.error("rule_files 为空，没有可运行的规则文件")
@@ -512,24 +673,13 @@ def run_continuous(rule_files: list[str] | None = None):
 
             if crawl_time_str:
                 try:
-                    # 解析时间字符串（格式：HH:MM，例如 "08:00"）
-                    hour, minute = map(int, crawl_time_str.split(':'))
-                    if not (0 <= hour < 24 and 0 <= minute < 60):
-                        raise ValueError("时间格式错误")
-
-                    now = datetime.now()
-                    today_crawl_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-
-                    # 如果今天的时间已过，则设置为明天
-                    if today_crawl_time <= now:
-                        next_crawl_time = today_crawl_time + timedelta(days=1)
-                    else:
-                        next_crawl_time = today_crawl_time
-
-                    wait_seconds = max(0, (next_crawl_time - now).total_seconds())
+                    hour, minute = _parse_crawl_time(crawl_time_str)
+                    next_crawl_time = _next_crawl_time(hour, minute)
+                    # 墙上时间只用于确定目标时刻，实际等待按单调时钟计时
+                    wait_seconds = max(0, next_crawl_time.timestamp() - time.time())
                     logger.info(f"[调度] 已设置定时爬取时间: {crawl_time_str}")
                     logger.info(f"[调度] 下次爬取时间: {next_crawl_time.strftime('%Y-%m-%d %H:%M:%S')}")
-                except (ValueError, AttributeError) as e:
+                except (ValueError, AttributeError, TypeError) as e:
                     logger.warning(f"[调度] 解析爬取时间失败 ({crawl_time_str}): {e}，将使用更新频率 {update_frequency_minutes} 分钟")
                     wait_seconds = update_frequency_seconds
 
@@ -541,50 +691,28 @@ def run_continuous(rule_files: list[str] | None = None):
                 else:
                     logger.info(f"[调度] 等待 {wait_minutes} 分钟后开始本轮爬取...")
 
-                wait_interval = 60  # 每60秒检查一次
-                waited = 0
-                while waited < wait_seconds and running:
-                    sleep_time = min(wait_interval, wait_seconds - waited)
-                    time.sleep(sleep_time)
-                    waited += sleep_time
-                    if waited % 3600 == 0:  # 每1小时打印一次剩余时间
-                        remaining_minutes = int(max(0, (wait_seconds - waited) // 60))
-                        logger.info(f"[调度] 距离本轮爬取还有约 {remaining_minutes} 分钟")
-
-                if not running:
+                # 每次最多等待1小时（之后打印剩余时间）；收到停止信号时 wait 立即返回。
+                # 截止时刻按单调时钟计算，不受系统时间调整影响
+                log_interval = 3600
+                deadline = time.monotonic() + wait_seconds
+                remaining = wait_seconds
+                while remaining > 0:
+                    if stop_event.wait(min(log_interval, remaining)):
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining > 0:
+                        logger.info(f"[调度] 距离本轮爬取还有约 {int(remaining // 60)} 分钟")
+
+                if stop_event.is_set():
                     break
 
-            # 到达本轮执行时间后，依次跑每一个规则文件
-            for rule_file in rule_files:
-                try:
-                    logger.info("=" * 60)
-                    logger.info(f"开始处理规则文件: {rule_file}")
-                    logger.info("=" * 60)
-
-                    (
-                        site_config,
-                        custom_config,
-                        storage_config_site,
-                        path_manager,
-                        org_exporter,
-                        index_manager,
-                        crawler,
-                    ) = setup_runtime(global_config, logger, rule_file)
-
-                    # 对于每个站点，使用其自己的存储配置（目前来自全局 storage，但为将来扩展保留）
-                    run_crawl(
-                        crawler=crawler,
-                        path_manager=path_manager,
-                        org_exporter=org_exporter,
-                        index_manager=index_manager,
-                        file_manager=file_manager,
-                        storage_config=storage_config_site,
-                        logger=logger,
-                    )
-                except FileNotFoundError:
+            # 到达本轮执行时间后，并发抓取每一个规则文件的站点（其他异常交给外层处理）
+            for rule_file, error in _run_rule_files(global_config, logger, file_manager, rule_files):
+                if isinstance(error, FileNotFoundError):
                     # 某个规则文件不存在时，记录错误但继续处理其他规则
                     logger.error(f"规则文件不存在，跳过: {rule_file}")
-                    continue
+                elif error is not None:
+                    raise error
 
         except KeyboardInterrupt:
             logger.info("收到键盘中断信号")
@@ -597,9 +725,7 @@ def run_continuous(rule_files: list[str] | None = None):
             # 即使出错也继续运行，等待下次更新
             logger.info("将按照当前更新频率在下一轮重试...")
     
-    logger.info("=" * 60)
-    logger.info("程序已停止")
-    logger.info("=" * 60)
+    _log_banner(logger, "程序已停止")
 
 def main(continuous: bool = True, repair: bool = False, rule_files: list[str] | None = None):
     """
@@ -621,5 +747,6 @@ def main(continuous: bool = True, repair: bool = False, rule_files: list[str] |
         run_once(rule_files=rule_files)
 
 if __name__ == "__main__":
+    args = parse_args()
     main(continuous=args.continuous, repair=args.repair)
 
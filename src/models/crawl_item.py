@@ -5,14 +5,30 @@ from typing import Any
 from datetime import datetime
 
 
-@dataclass
+# 修改后会使小写文本缓存失效的属性
+_LOWER_CACHE_SOURCES = frozenset(('title', 'other_info'))
+
+
+@dataclass(slots=True)
 class CrawlItem:
-    """爬取条目数据模型"""
+    """
+    爬取条目数据模型（使用 __slots__，不为每个实例分配 __dict__）
+    
+    注意：过滤器读取的小写文本缓存在 lower_cache 中。重新赋值 title / other_info，
+    或通过 summary / authors 的 setter 修改时缓存自动失效；直接修改 other_info 中的
+    摘要或作者（如 item.other_info['summary'] = ...）后需调用 invalidate_lower_cache()。
+    """
     
     title: str                    # 标题
     link: str                     # 链接
     published_time: datetime      # 发布时间
     other_info: dict[str, Any] = field(default_factory=dict)  # 其他信息（摘要、作者、分类等）
+    _lower_cache: dict[str, str] | None = field(default=None, init=False, repr=False, compare=False)  # 小写文本缓存
+    
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if name in _LOWER_CACHE_SOURCES:
+            object.__setattr__(self, '_lower_cache', None)
     
     def __post_init__(self):
         """初始化后处理"""
@@ -29,6 +45,31 @@ class CrawlItem:
     def summary(self, value: str):
         """设置摘要"""
         self.other_info['summary'] = value
+        # 摘要变化后，已缓存的小写文本失效
+        self.invalidate_lower_cache()
+    
+    @property
+    def lower_cache(self) -> dict[str, str]:
+        """
+        小写文本缓存（键为字段名，如 'title'、'summary'），
+        关键词过滤器和各文本过滤器共享，同一条目的同一字段只做一次 lower()
+        """
+        if self._lower_cache is None:
+            self._lower_cache = {}
+        return self._lower_cache
+    
+    def invalidate_lower_cache(self):
+        """清空小写文本缓存（直接修改 other_info 中的文本字段后调用）"""
+        self._lower_cache = None
+    
+    @property
+    def search_blob(self) -> str:
+        """小写的 “标题 摘要” 文本，供关键词过滤使用（每个条目只计算一次）"""
+        cache = self.lower_cache
+        blob = cache.get('search')
+        if blob is None:
+            blob = cache['search'] = f"{self.title} {self.summary or ''}".lower()
+        return blob
     
     @property
     def authors(self) -> list:
@@ -39,6 +80,7 @@ class CrawlItem:
     def authors(self, value: list):
         """设置作者列表"""
         self.other_info['authors'] = value
+        self.invalidate_lower_cache()
     
     @property
     def categories(self) -> list:
@@ -60,6 +102,33 @@ class CrawlItem:
             **self.other_info
         }
     
+    @staticmethod
+    def to_dict_batch(items: list['CrawlItem']) -> list[dict]:
+        """
+        批量转换为字典（结果与逐个调用 to_dict 相同）
+        
+        在一个推导式中完成，省去每个条目的方法调用；
+        published_time_str 直接从 isoformat 结果截取，不再单独调用 strftime。
+        
+        Args:
+            items: 条目列表
+            
+        Returns:
+            字典列表，与 items 顺序一致
+        """
+        results = []
+        append = results.append
+        for item in items:
+            published_time = item.published_time.isoformat()
+            append({
+                'title': item.title,
+                'link': item.link,
+                'published_time': published_time,
+                'published_time_str': f"{published_time[:10]} {published_time[11:19]}",
+                **item.other_info
+            })
+        return results
+    
     @classmethod
     def from_dict(cls, data: dict) -> 'CrawlItem':
         """从字典创建"""
@@ -153,17 +153,20 @@ class BaseOrgExporter(ABC):
                         result.append(str(value))
             return ''.join(result)
     
-    def export(self, result: CrawlResult, output_path: Path):
+    def export(self, result: CrawlResult, output_path: Path,
+               categorized_items: dict[str, list[dict]] | None = None):
         """
         导出为 org-mode 格式
         
         Args:
             result: 爬取结果
             output_path: 输出文件路径（如果启用分类，这将是基础路径）
+            categorized_items: 调用方已计算好的分类结果（可选），提供时不再重复分类
         """
         # 如果启用了分类，按类别分别导出
         if self.keyword_classifier and result.items_count > 0:
-            categorized_items = self.keyword_classifier.classify_items(result.items)
+            if categorized_items is None:
+                categorized_items = self.keyword_classifier.classify_items(result.items)
             
             for category, items in categorized_items.items():
                 # 获取该类别的文件夹路径
@@ -197,17 +200,20 @@ class BaseOrgExporter(ABC):
             # 直接覆盖文件（不再合并）
             output_path.write_text(org_content, encoding='utf-8')
     
-    def export_markdown(self, result: CrawlResult, output_path: Path):
+    def export_markdown(self, result: CrawlResult, output_path: Path,
+                        categorized_items: dict[str, list[dict]] | None = None):
         """
         导出为 Markdown 格式
         
         Args:
             result: 爬取结果
             output_path: 输出文件路径（如果启用分类，这将是基础路径）
+            categorized_items: 调用方已计算好的分类结果（可选），提供时不再重复分类
         """
         # 如果启用了分类，按类别分别导出
         if self.keyword_classifier and result.items_count > 0:
-            categorized_items = self.keyword_classifier.classify_items(result.items)
+            if categorized_items is None:
+                categorized_items = self.keyword_classifier.classify_items(result.items)
             
             for category, items in categorized_items.items():
                 # 获取该类别的文件夹路径
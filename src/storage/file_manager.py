@@ -80,8 +80,8 @@ class FileManager:
         metadata_path = self.base_path / site_name / "metadata.json"
         metadata_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
+        # 先在内存中序列化再一次写入（json.dump 会按片段多次调用 write）
+        metadata_path.write_text(json.dumps(metadata, ensure_ascii=False, indent=2), encoding='utf-8')
     
     def save_json(self, result: CrawlResult, storage_path: Path):
         """
@@ -120,23 +120,26 @@ class FileManager:
             'items': all_items
         }
         
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        json_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding='utf-8')
     
-    def update_metadata(self, result: CrawlResult, json_path: Path | None = None):
+    def update_metadata(self, result: CrawlResult, json_path: Path | None = None,
+                        items_count: int | None = None):
         """
         更新元数据
         
         Args:
             result: 爬取结果
             json_path: JSON 文件路径（可选），如果提供则从该文件读取条目数
+            items_count: 已知的条目数（可选），提供时直接使用，不再读回 JSON 文件
         """
         metadata = self.load_metadata(result.site_name)
         metadata['last_crawl_time'] = result.crawl_time.isoformat()
         metadata['last_update_date'] = result.crawl_time.strftime(self.date_format)
         
         # 更新总条目数
-        if json_path and json_path.exists():
+        if items_count is not None:
+            metadata['total_items'] = items_count
+        elif json_path and json_path.exists():
             try:
                 with open(json_path, 'r', encoding='utf-8') as f:
                     data = json.load(f)
@@ -1,8 +1,17 @@
 """翻译器模块：使用阿里云翻译 API 实现自动翻译"""
 
+import json
+from concurrent.futures import ThreadPoolExecutor
+
 from ..utils.logger import get_logger
 
 
+# 阿里云批量翻译接口单次请求的最大文本条数
+_BATCH_SIZE = 50
+# 同时进行的翻译请求数上限（多个批次、或批量失败后逐条回退时并发发送）
+_MAX_CONCURRENT_REQUESTS = 8
+
+
 class Translator:
     """翻译器类，使用阿里云翻译 API 实现标题和摘要的自动翻译"""
     
@@ -183,4 +192,114 @@ class Translator:
                 result['summary_zh'] = translated_summary
         
         return result
-
+    
+    def translate_batch(self, texts: list[str]) -> list[str | None]:
+        """
+        批量翻译文本（每 50 条合并为一次批量翻译请求，减少网络往返）
+        
+        多个批次并发发送；某一批请求失败时，该批回退为并发地逐条调用 translate()。
+        
+        Args:
+            texts: 要翻译的文本列表
+            
+        Returns:
+            与 texts 一一对应的翻译结果，翻译失败或文本为空的位置为 None
+        """
+        results: list[str | None] = [None] * len(texts)
+        if not self.enabled or self._client is None:
+            return results
+        
+        # 只提交非空文本，记录其在原列表中的位置
+        indexes = [i for i, text in enumerate(texts) if text and text.strip()]
+        if not indexes:
+            return results
+        chunks = [indexes[start:start + _BATCH_SIZE] for start in range(0, len(indexes), _BATCH_SIZE)]
+        
+        # SDK 的请求是阻塞调用，用线程池让多个请求的网络等待互相重叠
+        with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_REQUESTS) as executor:
+            batch_results = list(executor.map(
+                self._translate_batch_request,
+                [[texts[i] for i in chunk] for chunk in chunks]
+            ))
+            for chunk, translated in zip(chunks, batch_results):
+                if translated is None:
+                    translated = executor.map(self.translate, [texts[i] for i in chunk])
+                for i, text in zip(chunk, translated):
+                    results[i] = text
+        return results
+    
+    def _translate_batch_request(self, texts: list[str]) -> list[str | None] | None:
+        """
+        调用阿里云批量翻译接口（GetBatchTranslate）
+        
+        Args:
+            texts: 要翻译的文本列表（不超过 _BATCH_SIZE 条）
+            
+        Returns:
+            与 texts 一一对应的翻译结果；请求失败或响应异常时返回 None
+        """
+        try:
+            from alibabacloud_alimt20181012 import models as alimt_20181012_models
+            from alibabacloud_tea_util import models as util_models
+            
+            # 批量接口的 source_text 为 {编号: 文本} 形式的 JSON 字符串
+            request = alimt_20181012_models.GetBatchTranslateRequest(
+                format_type='text',
+                source_language=self.source_lang,
+                target_language=self.target_lang,
+                source_text=json.dumps({str(i): text for i, text in enumerate(texts)}, ensure_ascii=False),
+                scene='general',
+                api_type='translate_standard'
+            )
+            
+            runtime = util_models.RuntimeOptions()
+            resp = self._client.get_batch_translate_with_options(request, runtime)
+            
+            if not resp.body or resp.body.translated_list is None:
+                self.logger.warning(f"批量翻译响应格式异常: {resp}")
+                return None
+            
+            results: list[str | None] = [None] * len(texts)
+            for entry in resp.body.translated_list:
+                index = int(entry.get('index', -1))
+                if 0 <= index < len(texts) and str(entry.get('code', '200')) == '200':
+                    results[index] = entry.get('translated') or None
+            return results
+            
+        except Exception as e:
+            self.logger.warning(f"批量翻译失败: {e}，回退为逐条翻译")
+            return None
+    
+    def translate_items(self, items: list[dict], in_place: bool = False) -> list[dict]:
+        """
+        批量翻译多个条目（标题和摘要），所有文本合并为批量翻译请求
+        
+        Args:
+            items: 条目字典列表（包含 title 和 summary）
+            in_place: 是否直接在 items 的字典上写入翻译结果（调用方刚创建的字典无需再复制一份）
+            
+        Returns:
+            翻译后的条目字典列表（添加 title_zh 和 summary_zh 字段），与 items 顺序一致
+        """
+        if not self.enabled or not items:
+            return items
+        
+        # 每个条目依次放入标题和摘要，翻译结果按相同顺序取回
+        texts = []
+        for item_dict in items:
+            texts.append(item_dict.get('title', '') or '')
+            texts.append(item_dict.get('summary', '') or '')
+        translated = self.translate_batch(texts)
+        
+        results = items if in_place else []
+        for i, item_dict in enumerate(items):
+            result = item_dict if in_place else item_dict.copy()
+            translated_title = translated[2 * i]
+            translated_summary = translated[2 * i + 1]
+            if translated_title:
+                result['title_zh'] = translated_title
+            if translated_summary:
+                result['summary_zh'] = translated_summary
+            if not in_place:
+                results.append(result)
+        return results
@@ -8,10 +8,45 @@ from dotenv import load_dotenv
 
 from ..models.site_config import SiteConfig
 
+# PyYAML 带 libyaml 扩展时使用 C 实现的解析器，否则回退到纯 Python 版本（解析结果相同）
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 # 加载环境变量
 load_dotenv()
 
+# 已解析的 YAML 文件缓存：路径 -> ((mtime_ns, 文件大小), 解析结果)
+# 持续运行模式下每轮都会重新加载配置，文件未修改时直接复用上次的解析结果
+_YAML_CACHE: dict[str, tuple[tuple[int, int], Any]] = {}
+
+
+def _load_yaml(path: Path) -> Any:
+    """
+    读取并解析 YAML 文件，文件的修改时间和大小不变时返回缓存的解析结果
+    
+    缓存的结果不能被修改：调用方应通过 _replace_env_vars 生成新的字典/列表后再使用。
+    
+    Args:
+        path: YAML 文件路径
+        
+    Returns:
+        解析结果
+    """
+    stat = path.stat()
+    key = str(path.resolve())
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+    _YAML_CACHE[key] = (signature, data)
+    return data
+
 
 def load_global_config(config_path: str = "config/global_config.yaml") -> dict:
     """
@@ -44,10 +79,9 @@ def load_global_config(config_path: str = "config/global_config.yaml") -> dict:
             }
         }
     
-    with open(config_file, 'r', encoding='utf-8') as f:
-        config_raw = yaml.safe_load(f)
+    config_raw = _load_yaml(config_file)
     
-    # 替换环境变量
+    # 替换环境变量（同时生成新的字典/列表，调用方修改配置不会影响缓存）
     config_processed = _replace_env_vars(config_raw)
     
     # 确保 config 是字典类型
@@ -75,10 +109,9 @@ def load_rule_config(rule_path: str, global_config: dict | None = None) -> SiteC
     if not rule_file.exists():
         raise FileNotFoundError(f"规则文件不存在: {rule_path}")
     
-    with open(rule_file, 'r', encoding='utf-8') as f:
-        rule_data_raw = yaml.safe_load(f)
+    rule_data_raw = _load_yaml(rule_file)
     
-    # 替换环境变量
+    # 替换环境变量（同时生成新的字典/列表，下面写入 update_frequency 不会影响缓存）
     rule_data_processed = _replace_env_vars(rule_data_raw)
     
     # 确保 rule_data 是字典类型
@@ -0,0 +1,259 @@
+"""关键词多模式匹配（可选 Hyperscan / pyahocorasick / Numba 加速）
+
+关键词较多时，逐个关键词做子串查找的开销与关键词数量成正比。这里把所有关键词
+编译为多模式自动机，一次扫描即可找出文本中出现的全部关键词，按优先级选择：
+1. Hyperscan（SIMD 加速的多模式匹配库），关键词数量 >= 8 时使用
+2. pyahocorasick（C 扩展），关键词数量 >= 8 时使用
+3. Numba 编译的字节级 Aho-Corasick 自动机，关键词数量 >= 20 时使用
+
+都未安装（或关键词较少）时 build_keyword_automaton() 返回 None，
+调用方回退到合并正则路径（CPython 的 C 正则引擎在关键词较少时已经足够快）。
+"""
+
+import importlib.util
+import re
+from collections import deque
+from functools import lru_cache
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Numba 的导入开销较大（上百毫秒），这里只检查是否安装，真正构建 Numba 自动机时再导入
+_NUMBA_INSTALLED = (
+    importlib.util.find_spec("numba") is not None
+    and importlib.util.find_spec("numpy") is not None
+)
+
+
+# 关键词数量达到该值时才使用对应的自动机
+HYPERSCAN_MIN_KEYWORDS = 8
+AHOCORASICK_MIN_KEYWORDS = 8
+NUMBA_MIN_KEYWORDS = 20
+
+
+@lru_cache(maxsize=None)
+def _load_numba_kernel():
+    """
+    导入 numpy / Numba 并定义扫描内核（只在第一次构建 Numba 自动机时执行）
+
+    Returns:
+        (numpy 模块, 扫描内核)；导入失败时返回 None
+    """
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:
+        return None
+
+    @njit(cache=True)
+    def _aho_corasick_match(blob_u8, goto, out_start, out_index, found):
+        """
+        扫描字节数组，将命中的关键词下标在 found 中标记为 True
+
+        Args:
+            blob_u8: 文本的 UTF-8 字节（np.uint8 数组）
+            goto: 完整的状态转移表，形状为 (状态数, 256)
+            out_start: 每个状态的输出在 out_index 中的起始位置（长度为状态数 + 1）
+            out_index: 按状态拼接的关键词下标
+            found: 输出数组，长度为关键词数量
+        """
+        state = 0
+        for i in range(blob_u8.shape[0]):
+            state = goto[state, blob_u8[i]]
+            for j in range(out_start[state], out_start[state + 1]):
+                found[out_index[j]] = True
+
+    return np, _aho_corasick_match
+
+
+class KeywordAutomaton:
+    """由一组（已小写的）关键词构建的 Aho-Corasick 自动机"""
+
+    def __init__(self, keywords_lower: list[str]):
+        """
+        Args:
+            keywords_lower: 小写关键词列表，find() 返回的下标与此列表对应
+        """
+        self.keyword_count = len(keywords_lower)
+        # 空关键词与 `'' in text` 的语义一致：总是命中
+        self._always_matched = [i for i, keyword in enumerate(keywords_lower) if not keyword]
+
+    def find(self, text: str) -> list[int]:
+        """
+        找出文本中出现的全部关键词
+
+        Args:
+            text: 待匹配文本（应与关键词使用相同的大小写形式）
+
+        Returns:
+            命中关键词的下标列表（升序）
+        """
+        raise NotImplementedError
+
+    def contains_any(self, text: str) -> bool:
+        """
+        判断文本中是否出现任一关键词
+
+        Args:
+            text: 待匹配文本
+
+        Returns:
+            是否命中
+        """
+        return bool(self._always_matched) or bool(self.find(text))
+
+
+class HyperscanKeywordAutomaton(KeywordAutomaton):
+    """基于 Hyperscan 的关键词匹配（关键词按字面量编译为一个数据库）"""
+
+    def __init__(self, keywords_lower: list[str]):
+        super().__init__(keywords_lower)
+        # Hyperscan 不接受空模式，空关键词由 _always_matched 处理
+        ids = [index for index, keyword in enumerate(keywords_lower) if keyword]
+        self._database = None
+        if ids:
+            self._database = hyperscan.Database()
+            self._database.compile(
+                # 关键词按 UTF-8 字节转义为字面量；文本和关键词都已小写，无需 CASELESS
+                expressions=[re.escape(keywords_lower[index].encode('utf-8')) for index in ids],
+                ids=ids,
+                elements=len(ids),
+                # 每个关键词只报告一次命中
+                flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(ids),
+            )
+
+    def find(self, text: str) -> list[int]:
+        found = set(self._always_matched)
+        if self._database is not None:
+            def on_match(index, start, end, flags, context):
+                found.add(index)
+            self._database.scan(text.encode('utf-8'), match_event_handler=on_match)
+        return sorted(found)
+
+
+class PyAhoCorasickAutomaton(KeywordAutomaton):
+    """基于 pyahocorasick（C 扩展）的关键词自动机"""
+
+    def __init__(self, keywords_lower: list[str]):
+        super().__init__(keywords_lower)
+        # 相同的关键词可能出现多次，每个关键词对应其全部下标
+        indexes_by_keyword: dict[str, list[int]] = {}
+        for index, keyword in enumerate(keywords_lower):
+            if keyword:
+                indexes_by_keyword.setdefault(keyword, []).append(index)
+        self._automaton = None
+        if indexes_by_keyword:
+            self._automaton = ahocorasick.Automaton()
+            for keyword, indexes in indexes_by_keyword.items():
+                self._automaton.add_word(keyword, tuple(indexes))
+            self._automaton.make_automaton()
+
+    def find(self, text: str) -> list[int]:
+        found = set(self._always_matched)
+        if self._automaton is not None:
+            for _, indexes in self._automaton.iter(text):
+                found.update(indexes)
+        return sorted(found)
+
+    def contains_any(self, text: str) -> bool:
+        if self._always_matched:
+            return True
+        # 找到第一个命中即停止扫描
+        return self._automaton is not None and next(self._automaton.iter(text), None) is not None
+
+
+class NumbaKeywordAutomaton(KeywordAutomaton):
+    """字节级、已展开为完整状态转移表的自动机，扫描内核由 Numba 编译"""
+
+    def __init__(self, keywords_lower: list[str]):
+        super().__init__(keywords_lower)
+        np, self._kernel = _load_numba_kernel()
+        self._np = np
+
+        # 1. 构建字节级 trie
+        goto_rows: list[list[int]] = [[-1] * 256]
+        outputs: list[list[int]] = [[]]
+        for index, keyword in enumerate(keywords_lower):
+            if not keyword:
+                continue
+            state = 0
+            for byte in keyword.encode('utf-8'):
+                next_state = goto_rows[state][byte]
+                if next_state == -1:
+                    next_state = len(goto_rows)
+                    goto_rows.append([-1] * 256)
+                    outputs.append([])
+                    goto_rows[state][byte] = next_state
+                state = next_state
+            outputs[state].append(index)
+
+        # 2. 按 BFS 顺序计算失败指针，并把缺失的转移展开为完整的 DFA，
+        #    扫描时无需再沿失败指针回溯
+        fail = [0] * len(goto_rows)
+        queue: deque[int] = deque()
+        root = goto_rows[0]
+        for byte in range(256):
+            if root[byte] == -1:
+                root[byte] = 0
+            else:
+                queue.append(root[byte])
+        while queue:
+            state = queue.popleft()
+            # 失败指针指向更浅的状态，其输出在 BFS 中已合并完整
+            outputs[state].extend(outputs[fail[state]])
+            row = goto_rows[state]
+            fail_row = goto_rows[fail[state]]
+            for byte in range(256):
+                next_state = row[byte]
+                if next_state == -1:
+                    row[byte] = fail_row[byte]
+                else:
+                    fail[next_state] = fail_row[byte]
+                    queue.append(next_state)
+
+        # 3. 转换为 numpy 数组供 Numba 内核使用
+        out_start = [0]
+        out_index: list[int] = []
+        for output in outputs:
+            out_index.extend(output)
+            out_start.append(len(out_index))
+        self._goto = np.array(goto_rows, dtype=np.int32)
+        self._out_start = np.array(out_start, dtype=np.int32)
+        self._out_index = np.array(out_index, dtype=np.int32)
+
+    def find(self, text: str) -> list[int]:
+        np = self._np
+        blob_u8 = np.frombuffer(text.encode('utf-8'), dtype=np.uint8)
+        found = np.zeros(self.keyword_count, dtype=np.bool_)
+        for index in self._always_matched:
+            found[index] = True
+        self._kernel(blob_u8, self._goto, self._out_start, self._out_index, found)
+        return np.flatnonzero(found).tolist()
+
+
+def build_keyword_automaton(keywords_lower: list[str]) -> KeywordAutomaton | None:
+    """
+    按需构建关键词自动机
+
+    Args:
+        keywords_lower: 小写关键词列表
+
+    Returns:
+        自动机；未安装加速库或关键词数量较少时返回 None
+    """
+    keyword_count = len(keywords_lower)
+    if hyperscan is not None and keyword_count >= HYPERSCAN_MIN_KEYWORDS:
+        return HyperscanKeywordAutomaton(keywords_lower)
+    if ahocorasick is not None and keyword_count >= AHOCORASICK_MIN_KEYWORDS:
+        return PyAhoCorasickAutomaton(keywords_lower)
+    if (_NUMBA_INSTALLED and keyword_count >= NUMBA_MIN_KEYWORDS
+            and _load_numba_kernel() is not None):
+        return NumbaKeywordAutomaton(keywords_lower)
+    return None
@@ -0,0 +1,134 @@
+"""RSS 条件请求（ETag / Last-Modified）状态保存测试"""
+
+import functools
+import http.server
+import logging
+import threading
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.crawler.rss_crawler import BaseRSSCrawler
+from src.main import run_crawl
+from src.models.site_config import SiteConfig
+
+
+FEED = f"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>test</title>
+<item><title>First paper</title><link>http://example.com/1</link>
+<description>summary</description><pubDate>{format_datetime(datetime.now(timezone.utc))}</pubDate></item>
+<item><title>Second study</title><link>http://example.com/2</link>
+<description>summary</description><pubDate>{format_datetime(datetime.now(timezone.utc))}</pubDate></item>
+</channel></rss>""".encode('utf-8')
+
+ETAG = '"v1"'
+
+
+class _FeedHandler(http.server.BaseHTTPRequestHandler):
+    """返回固定 feed 的服务器，If-None-Match 命中时返回 304"""
+
+    def __init__(self, *args, statuses: list[int], **kwargs):
+        self.statuses = statuses
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):
+        if self.headers.get('If-None-Match') == ETAG:
+            self.statuses.append(304)
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.statuses.append(200)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/rss+xml')
+        self.send_header('ETag', ETAG)
+        self.send_header('Content-Length', str(len(FEED)))
+        self.end_headers()
+        self.wfile.write(FEED)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def feed_server():
+    statuses: list[int] = []
+    server = http.server.ThreadingHTTPServer(
+        ('127.0.0.1', 0), functools.partial(_FeedHandler, statuses=statuses)
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_address[1]}/feed.xml', statuses
+    server.shutdown()
+    server.server_close()
+
+
+class _Exporter:
+    """只记录导出次数的导出器，fail=True 时模拟写文件失败"""
+
+    keyword_classifier = None
+    category_folders: dict = {}
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.exported = 0
+
+    def export(self, result, path, categorized_items=None):
+        if self.fail:
+            raise FileExistsError(17, 'File exists', str(path))
+        self.exported += result.items_count
+
+
+def _run(url: str, state_dir: Path, exporter: _Exporter, keywords: list[str] | None = None) -> bool:
+    site_config = SiteConfig(
+        name='conditional_get_test',
+        url=url,
+        crawl_type='rss',
+        update_frequency=60,
+        storage_path='test',
+        enabled=True,
+        keywords=keywords or [],
+        custom_config={'state_dir': str(state_dir)},
+    )
+    crawler = BaseRSSCrawler(site_config)
+    path_manager = SimpleNamespace(get_output_path=lambda site_name, date: state_dir / 'out.org')
+    file_manager = SimpleNamespace(update_metadata=lambda *args, **kwargs: None)
+    return run_crawl(
+        crawler, path_manager, exporter, None, file_manager,
+        {'output_format': 'org'}, logging.getLogger(__name__)
+    )
+
+
+def test_export_failure_does_not_save_etag(feed_server, tmp_path):
+    url, statuses = feed_server
+
+    # 导出失败：不保存 ETag
+    assert not _run(url, tmp_path, _Exporter(fail=True))
+    assert not (tmp_path / 'conditional_get_test.json').exists()
+
+    # 下次运行仍然完整下载 feed，条目不会因 304 丢失
+    exporter = _Exporter()
+    assert _run(url, tmp_path, exporter)
+    assert statuses == [200, 200]
+    assert exporter.exported == 2
+
+    # 导出成功后才保存 ETag，之后的运行发送条件请求
+    assert (tmp_path / 'conditional_get_test.json').exists()
+    exporter = _Exporter()
+    assert _run(url, tmp_path, exporter)
+    assert statuses == [200, 200, 304]
+    assert exporter.exported == 0
+
+
+def test_filter_change_skips_conditional_request(feed_server, tmp_path):
+    url, statuses = feed_server
+
+    assert _run(url, tmp_path, _Exporter(), keywords=['paper'])
+    assert statuses == [200]
+
+    # 过滤条件变化后，上次被过滤掉的条目需要重新下载
+    exporter = _Exporter()
+    assert _run(url, tmp_path, exporter, keywords=['study'])
+    assert statuses == [200, 200]
+    assert exporter.exported == 1
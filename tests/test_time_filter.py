@@ -0,0 +1,32 @@
+"""时间过滤器在共享实例上的时间上下文测试"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from src.filters.logical import NotFilter
+from src.filters.manager import FilterManager
+from src.filters.time_filter import TimeContext, use_time_context
+from src.models.crawl_item import CrawlItem
+
+
+def _item(published_time: datetime) -> CrawlItem:
+    return CrawlItem(title='t', link='http://example.com', published_time=published_time)
+
+
+def test_nested_time_filter_uses_context_per_thread():
+    configs = [{'type': 'not', 'filter': {'type': 'time_range', 'yesterday': True}}]
+    not_filter = FilterManager.create_filters(configs)[0]
+    # 配置相同的过滤器链是同一组实例
+    assert FilterManager.create_filters(list(configs))[0] is not_filter
+    assert isinstance(not_filter, NotFilter)
+
+    item = _item(datetime(2024, 1, 1, 12))
+
+    def match_on(day: int) -> bool:
+        with use_time_context(TimeContext(datetime(2024, 1, day, 8))):
+            return not_filter.match(item)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(match_on, [2, 3] * 50))
+    # 1 月 2 日时该条目是"昨天"的（被 NOT 排除），1 月 3 日时不是
+    assert results == [False, True] * 50